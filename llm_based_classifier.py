@@ -63,7 +63,11 @@ class LLMJobClassifyOrchestrator:
             self.classifier = LLMJobClassifier(
                 api_key=groq_key,
                 model=model,
-                threshold=threshold
+                threshold=threshold,
+                use_semantic_cache=os.getenv("LLM_SEMANTIC_CACHE", "false").lower() == "true",
+                semantic_cache_path=os.getenv("LLM_SEMANTIC_CACHE_PATH", "output/llm_cache/semantic"),
+                stream=os.getenv("LLM_STREAM", "false").lower() == "true",
+                reuse_prompt_context=os.getenv("LLM_REUSE_PROMPT_CONTEXT", "false").lower() == "true"
             )
             
             # Initialize NER Validator
@@ -405,6 +409,11 @@ class LLMJobClassifyOrchestrator:
                 logger.error(f" Failed to save {category} JSON: {e}")
                 
         print("="*60)
+        self.classifier.save_cache()
+        logger.info(
+            f"LLM calls avoided: {self.classifier.direct_hits} direct (trivial text), "
+            f"{self.classifier.response_cache.hits} exact-cache hits"
+        )
         logger.info(f"Classification run complete. Stats: {stats}")
 
     def _log_audit(self, raw_id: int, result: dict):
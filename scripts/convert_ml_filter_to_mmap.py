@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Convert ML Filter to a memory-mappable layout
+
+Splits the pickled recruiter vectorizer so that MLFilter can share it
+across worker processes read-only:
+  - vocab_terms.npy / vocab_indices.npy : sorted vocabulary + column indices
+  - vectorizer_skeleton.pkl             : vectorizer without vocabulary_
+                                          (idf_ array mmap-able via joblib)
+classifier.pkl is re-dumped uncompressed (via a temp file and os.replace)
+so joblib can mmap its arrays.
+MLFilter only loads this layout when filters.ml_mmap_vocabulary is true;
+lookups are slower than the pickled dict, so enable it for memory, not speed.
+
+Usage:
+    python scripts/convert_ml_filter_to_mmap.py [model_dir]
+"""
+
+import argparse
+import copy
+import os
+import sys
+
+import joblib
+import numpy as np
+
+
+def convert(model_dir: str):
+    vectorizer = joblib.load(os.path.join(model_dir, "vectorizer.pkl"))
+    classifier = joblib.load(os.path.join(model_dir, "classifier.pkl"))
+
+    terms = sorted(vectorizer.vocabulary_)
+    np.save(os.path.join(model_dir, "vocab_terms.npy"), np.array(terms, dtype=str))
+    np.save(
+        os.path.join(model_dir, "vocab_indices.npy"),
+        np.array([vectorizer.vocabulary_[term] for term in terms], dtype=np.int32),
+    )
+
+    skeleton = copy.deepcopy(vectorizer)
+    del skeleton.vocabulary_
+    # stop_words_ is only kept for introspection and can be large
+    if hasattr(skeleton, "stop_words_"):
+        del skeleton.stop_words_
+    joblib.dump(skeleton, os.path.join(model_dir, "vectorizer_skeleton.pkl"))
+
+    # Uncompressed dump so joblib.load(mmap_mode="r") can map the coefficient arrays.
+    # Written beside the original and swapped in, so a failed dump never
+    # leaves a truncated classifier.pkl behind.
+    classifier_path = os.path.join(model_dir, "classifier.pkl")
+    tmp_path = classifier_path + ".tmp"
+    try:
+        joblib.dump(classifier, tmp_path)
+        os.replace(tmp_path, classifier_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    print(f"[OK] Wrote memory-mappable model ({len(terms)} terms) to {model_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the ML recruiter filter to a memory-mappable layout")
+    parser.add_argument("model_dir", nargs="?", default="models", help="Directory with vectorizer.pkl/classifier.pkl")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.model_dir):
+        print(f"[ERROR] Model directory not found: {args.model_dir}")
+        sys.exit(1)
+
+    convert(args.model_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Convert ML Filter to ONNX
+
+Fuses the pickled recruiter vectorizer + classifier (vectorizer.pkl,
+classifier.pkl) into a single model.onnx that MLFilter serves with
+ONNX Runtime instead of running sklearn in Python.
+
+Usage:
+    python scripts/convert_ml_filter_to_onnx.py [model_dir] [--quantize]
+
+Requires: skl2onnx, onnxruntime (offline only; not needed at run time
+unless model.onnx is present).
+"""
+
+import argparse
+import os
+import sys
+
+import joblib
+
+
+def convert(model_dir: str, quantize: bool) -> str:
+    from sklearn.pipeline import Pipeline
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import StringTensorType
+
+    vectorizer = joblib.load(os.path.join(model_dir, "vectorizer.pkl"))
+    classifier = joblib.load(os.path.join(model_dir, "classifier.pkl"))
+    pipeline = Pipeline([("vectorizer", vectorizer), ("classifier", classifier)])
+
+    onnx_model = convert_sklearn(
+        pipeline,
+        initial_types=[("input", StringTensorType([None, 1]))],
+        options={
+            # The default en_US locale is missing on slim images (e.g. python:3.11-slim)
+            id(vectorizer): {"locale": "C"},
+            id(classifier): {"zipmap": False},
+        },
+    )
+
+    onnx_path = os.path.join(model_dir, "model.onnx")
+    with open(onnx_path, "wb") as f:
+        f.write(onnx_model.SerializeToString())
+    print(f"[OK] Wrote {onnx_path}")
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        fp32_path = os.path.join(model_dir, "model.fp32.onnx")
+        os.replace(onnx_path, fp32_path)
+        quantize_dynamic(fp32_path, onnx_path, weight_type=QuantType.QInt8)
+        print(f"[OK] Quantized to int8: {onnx_path} (fp32 copy kept at {fp32_path})")
+
+    return onnx_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the ML recruiter filter to ONNX")
+    parser.add_argument("model_dir", nargs="?", default="models", help="Directory with vectorizer.pkl/classifier.pkl")
+    parser.add_argument("--quantize", action="store_true", help="Dynamically quantize weights to int8")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.model_dir):
+        print(f"[ERROR] Model directory not found: {args.model_dir}")
+        sys.exit(1)
+
+    convert(args.model_dir, args.quantize)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,33 @@
+import atexit
+import gzip
 import httpx
 import logging
-from typing import Optional, Dict, Any
+import orjson
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 import os
+import ssl
+import threading
 import time
 
 logger = logging.getLogger(__name__)
 
+# Shared TLS context: keeps hostname verification on and lets every client in
+# the process resume TLS sessions instead of doing a full handshake each time.
+_SSL_CTX: Optional[ssl.SSLContext] = None
+
+def _get_ssl_context() -> ssl.SSLContext:
+    """Build the shared SSL context on first use (after .env has been loaded)"""
+    global _SSL_CTX
+    if _SSL_CTX is None:
+        ctx = ssl.create_default_context()
+        ca_bundle = os.getenv('API_CA_BUNDLE')
+        if ca_bundle:
+            # Trust extra (e.g. self-signed dev) certificates without disabling verification
+            ctx.load_verify_locations(ca_bundle)
+        _SSL_CTX = ctx
+    return _SSL_CTX
+
 class APIClient:
     """
     API client for Whitebox Learning platform
@@ -14,6 +35,11 @@ class APIClient:
     """
     
     DEFAULT_TIMEOUT = 120
+    # Keep-alive pool shared by every caller of this client (service phases,
+    # candidate runner threads, workflow manager)
+    POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    # Bodies above this size are gzip-compressed when API_GZIP_REQUESTS is on
+    GZIP_MIN_BYTES = 4096
     
     def __init__(self, base_url: str, email: str, password: str, employee_id: int):
         self.base_url = base_url.rstrip('/')
@@ -22,13 +48,18 @@ class APIClient:
         self.employee_id = employee_id
         self.token = None
         self.token_expiry = None
+        # One client is shared process-wide; token refreshes must not race
+        self._auth_lock = threading.RLock()
         self.logger = logging.getLogger(__name__)
+        # Request-body compression needs server-side support, so it is opt-in
+        self.gzip_requests = os.getenv('API_GZIP_REQUESTS', '').lower() in ('1', 'true', 'yes')
         
         # specific fix #2: Use persistent session
         self.session = httpx.Client(
             base_url=self.base_url, 
             timeout=self.DEFAULT_TIMEOUT,
-            verify=False,  # optimization for local/dev env if needed, usually True for prod
+            verify=_get_ssl_context(),
+            limits=self.POOL_LIMITS,
             follow_redirects=True  # Fix for 307 redirects
         )
         # Initialize standard headers
@@ -49,6 +80,10 @@ class APIClient:
         Authenticate with the API and get bearer token
         Uses OAuth2 form-encoded authentication
         """
+        with self._auth_lock:
+            return self._authenticate()
+
+    def _authenticate(self) -> bool:
         try:
             # Login endpoint - FastAPI OAuth2
             # Note: base_url is already in session, but login often implies full URL or relative
@@ -95,8 +130,17 @@ class APIClient:
     def _ensure_auth(self):
         """Ensure valid session auth header exists"""
         if not self._is_token_valid():
-            if not self.authenticate():
-                raise Exception("Failed to authenticate with API")
+            with self._auth_lock:
+                # Another thread may have refreshed the token while we waited
+                if not self._is_token_valid() and not self.authenticate():
+                    raise Exception("Failed to authenticate with API")
+
+    def _refresh_auth(self, stale_token) -> bool:
+        """Re-authenticate after a 401 unless another thread already replaced stale_token."""
+        with self._auth_lock:
+            if self.token is not None and self.token != stale_token:
+                return True
+            return self.authenticate()
 
     def _handle_request_with_retry(self, method_name, endpoint, **kwargs):
         """
@@ -123,16 +167,25 @@ class APIClient:
                 # Let's use self.session.request for maximum control, or mapped method
                 method = getattr(self.session, method_name)
                 
-                if method_name in ['post', 'put', 'patch']:
-                    self.logger.info(f"DEBUG: {method_name.upper()} {url} | Payload: {kwargs.get('json', 'No JSON')}")
+                if method_name in ['post', 'put', 'patch'] and self.logger.isEnabledFor(logging.DEBUG):
+                    body = kwargs.get('content')
+                    encoding = (kwargs.get('headers') or {}).get('Content-Encoding')
+                    if body is None:
+                        self.logger.debug("%s %s | No body", method_name.upper(), url)
+                    elif encoding:
+                        # Compressed bytes are unreadable; log the size instead
+                        self.logger.debug("%s %s | Body: %d bytes (%s)", method_name.upper(), url, len(body), encoding)
+                    else:
+                        self.logger.debug("%s %s | Payload: %s", method_name.upper(), url, body.decode('utf-8', 'replace'))
 
                 # Note: If we use full URL, we should pass it. httpx handles full URL even if base_url is set.
+                token_used = self.token
                 response = method(url, **kwargs)
                 
                 # Check for 401 Unauthorized
                 if response.status_code == 401:
                     self.logger.warning(f"Request to {endpoint} returned 401. Refreshing token...")
-                    if self.authenticate():
+                    if self._refresh_auth(token_used):
                         # Retry
                         continue
                     else:
@@ -160,21 +213,35 @@ class APIClient:
         response.raise_for_status()
         return response.json()
     
+    def _json_body(self, data: Any) -> Dict[str, Any]:
+        """
+        Request kwargs carrying data encoded once with orjson (no body for None).
+        Large bodies are gzipped at level 1 when API_GZIP_REQUESTS is enabled.
+        """
+        if data is None:
+            return {}
+        body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        headers = {'Content-Type': 'application/json'}
+        if self.gzip_requests and len(body) > self.GZIP_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers['Content-Encoding'] = 'gzip'
+        return {'content': body, 'headers': headers}
+
     def post(self, endpoint: str, data: Dict) -> Any:
-        response = self._handle_request_with_retry('post', endpoint, json=data)
+        response = self._handle_request_with_retry('post', endpoint, **self._json_body(data))
         if response.status_code >= 400:
             self.logger.error(f"POST {endpoint} failed: {response.status_code}")
         response.raise_for_status()
         return response.json()
     
     def put(self, endpoint: str, data: Dict) -> Any:
-        response = self._handle_request_with_retry('put', endpoint, json=data)
+        response = self._handle_request_with_retry('put', endpoint, **self._json_body(data))
         self.logger.info(f"PUT {endpoint} | Status: {response.status_code}")
         response.raise_for_status()
         return response.json()
 
     def patch(self, endpoint: str, data: Dict) -> Any:
-        response = self._handle_request_with_retry('patch', endpoint, json=data)
+        response = self._handle_request_with_retry('patch', endpoint, **self._json_body(data))
         self.logger.info(f"PATCH {endpoint} | Status: {response.status_code}")
         response.raise_for_status()
         return response.json()
@@ -184,8 +251,28 @@ class APIClient:
         response.raise_for_status()
         return response.json()
 
+    def close(self):
+        """Close the pooled connections"""
+        self.session.close()
+
+_api_clients: Dict[Tuple[str, str, int], APIClient] = {}
+_api_clients_lock = threading.Lock()
+
+def _close_api_clients():
+    for client in _api_clients.values():
+        try:
+            client.close()
+        except Exception:
+            pass
+
+atexit.register(_close_api_clients)
+
 def get_api_client() -> APIClient:
-    """Factory function for APIClient"""
+    """
+    Factory function for APIClient.
+    Returns one shared client per credential set so the connection pool and
+    auth token are reused across the whole process.
+    """
     base_url = os.getenv('API_BASE_URL')
     email = os.getenv('API_EMAIL')
     password = os.getenv('API_PASSWORD')
@@ -194,4 +281,10 @@ def get_api_client() -> APIClient:
     if not all([base_url, email, password, employee_id]):
         raise ValueError("Missing required environment variables")
     
-    return APIClient(base_url, email, password, employee_id)
+    key = (base_url.rstrip('/'), email, employee_id)
+    with _api_clients_lock:
+        client = _api_clients.get(key)
+        if client is None or client.session.is_closed:
+            client = APIClient(base_url, email, password, employee_id)
+            _api_clients[key] = client
+        return client
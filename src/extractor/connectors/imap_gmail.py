@@ -1,5 +1,6 @@
 import imaplib
 import logging
+import time
 from typing import Optional, List
 
 class GmailIMAPConnector:
@@ -11,6 +12,9 @@ class GmailIMAPConnector:
     # Hardcoded IMAP settings (same for all candidates)
     IMAP_SERVER = 'imap.gmail.com'
     IMAP_PORT = 993
+
+    # Skip the NOOP round-trip if the connection was proven alive this recently
+    NOOP_INTERVAL_SECONDS = 30
     
     def __init__(self, email: str, password: str):
         """
@@ -23,6 +27,8 @@ class GmailIMAPConnector:
         self.email = email
         self.password = password
         self.connection = None
+        self._last_noop_monotonic = 0
+        self._selected_folder = None
         self.logger = logging.getLogger(__name__)
     
     def connect(self) -> tuple:
@@ -39,6 +45,7 @@ class GmailIMAPConnector:
             self.logger.info(f"Connecting to {self.IMAP_SERVER}:{self.IMAP_PORT}...")
             self.connection = imaplib.IMAP4_SSL(self.IMAP_SERVER, self.IMAP_PORT)
             self.connection.login(self.email, self.password)
+            self._last_noop_monotonic = time.monotonic()
             self.logger.info(f"Successfully connected to {self.email}")
             return True, None
 
@@ -69,7 +76,11 @@ class GmailIMAPConnector:
     
     def is_connected(self) -> bool:
         """
-        Check if IMAP connection is active
+        Check if IMAP connection is active.
+
+        A NOOP is only sent when the connection has been idle for longer than
+        NOOP_INTERVAL_SECONDS; otherwise the connection is trusted and the
+        round-trip is skipped.
         
         Returns:
             True if connected, False otherwise
@@ -77,11 +88,35 @@ class GmailIMAPConnector:
         try:
             if self.connection is None:
                 return False
+            if time.monotonic() - self._last_noop_monotonic <= self.NOOP_INTERVAL_SECONDS:
+                return True
             # Try to check connection status
             status = self.connection.noop()
-            return status[0] == 'OK'
+            if status[0] == 'OK':
+                self._last_noop_monotonic = time.monotonic()
+                return True
+            return False
         except:
             return False
+
+    def uid(self, *args):
+        """
+        Run an IMAP UID command (search, fetch, ...), reconnecting and
+        retrying once if the connection has dropped (abort / socket error).
+        """
+        try:
+            result = self.connection.uid(*args)
+        except (imaplib.IMAP4.abort, OSError) as e:
+            self.logger.warning(f"IMAP connection lost for {self.email} ({str(e)}), reconnecting...")
+            self._last_noop_monotonic = 0
+            success, error = self.connect()
+            if not success:
+                raise
+            if self.connection.state != 'SELECTED' and self._selected_folder:
+                self.connection.select(self._selected_folder)
+            result = self.connection.uid(*args)
+        self._last_noop_monotonic = time.monotonic()
+        return result
     
     def disconnect(self):
         """Close IMAP connection"""
@@ -105,6 +140,7 @@ class GmailIMAPConnector:
         try:
             status, messages = self.connection.select(folder)
             if status == 'OK':
+                self._selected_folder = folder
                 num_messages = int(messages[0])
                 self.logger.info(f"Selected {folder} - {num_messages} emails")
                 return True
@@ -125,7 +161,7 @@ class GmailIMAPConnector:
             List of email UIDs
         """
         try:
-            status, messages = self.connection.uid('search', None, search_criteria)
+            status, messages = self.uid('search', None, search_criteria)
             if status == 'OK':
                 uids = messages[0].split()
                 self.logger.info(f"Found {len(uids)} emails matching criteria: {search_criteria}")
@@ -147,7 +183,7 @@ class GmailIMAPConnector:
             Email message or None
         """
         try:
-            status, data = self.connection.uid('fetch', uid, '(RFC822)')
+            status, data = self.uid('fetch', uid, '(RFC822)')
             if status == 'OK':
                 return data[0][1]
             return None
@@ -4,6 +4,25 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Common reply patterns (split at first occurrence), applied in order
+_REPLY_SPLIT_PATTERNS = tuple(
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        r"On .+ wrote:",
+        r"From:.+Sent:.+To:.+Subject:",
+        r"_{5,}",  # Long underscores (email separators)
+        r"-{5,}",  # Long dashes (email separators)
+        r"Begin forwarded message:",
+        r"\bwrote:\s*$",  # Standalone "wrote:" at end of line
+    )
+)
+_DEVICE_SIGNATURE_RE = re.compile(
+    r'\n\s*Sent from my (iPhone|Android|iPad|Samsung|BlackBerry|Windows Phone|mobile device)[^\n]*',
+    re.IGNORECASE
+)
+_MULTI_SPACE_RE = re.compile(r' +')
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+
 class EmailCleaner:
     """Clean and sanitize email content for extraction"""
     
@@ -44,19 +63,8 @@ class EmailCleaner:
     
     def _remove_quoted_replies(self, text: str) -> str:
         """Remove quoted email replies and forwarded messages"""
-        # Common reply patterns (split at first occurrence)
-        split_patterns = [
-            r"On .+ wrote:",
-            r"From:.+Sent:.+To:.+Subject:",
-            r"_{5,}",  # Long underscores (email separators)
-            r"-{5,}",  # Long dashes (email separators)
-            r"Begin forwarded message:",
-            r"\bwrote:\s*$",  # Standalone "wrote:" at end of line
-        ]
-
-        for pattern in split_patterns:
-            parts = re.split(pattern, text, maxsplit=1, flags=re.MULTILINE)
-            text = parts[0]
+        for pattern in _REPLY_SPLIT_PATTERNS:
+            text = pattern.split(text, maxsplit=1)[0]
 
         # Strip lines that begin with ">" (standard plain-text quoted reply format)
         # e.g.  > On Mon, Jan 1 John Doe <john@x.com> wrote:
@@ -71,22 +79,17 @@ class EmailCleaner:
         text = '\n'.join(cleaned_lines)
 
         # Remove "Sent from my iPhone / Android / …" device signatures (common in plain-text)
-        text = re.sub(
-            r'\n\s*Sent from my (iPhone|Android|iPad|Samsung|BlackBerry|Windows Phone|mobile device)[^\n]*',
-            '',
-            text,
-            flags=re.IGNORECASE
-        )
+        text = _DEVICE_SIGNATURE_RE.sub('', text)
 
         return text
     
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize excessive whitespace and blank lines"""
         # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        text = _MULTI_SPACE_RE.sub(' ', text)
         
         # Replace multiple newlines with max 2
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _EXCESS_NEWLINES_RE.sub('\n\n', text)
         
         # Remove trailing/leading whitespace from each line
         lines = [line.strip() for line in text.split('\n')]
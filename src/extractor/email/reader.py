@@ -1,15 +1,25 @@
 import email
+import imaplib
+import re
 from email.header import decode_header
 from typing import List, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on UIDs per FETCH command; keeps the command line well under
+# server request-size limits. Oversized batches are split on error anyway.
+MAX_FETCH_BATCH_SIZE = 500
+
+_FETCH_UID_RE = re.compile(rb'UID (\d+)')
+
+
 class EmailReader:
     """Read and fetch emails from IMAP connection"""
     
-    def __init__(self, connector):
+    def __init__(self, connector, fetch_batch_size: int = 100):
         self.connector = connector
+        self.fetch_batch_size = max(1, min(int(fetch_batch_size), MAX_FETCH_BATCH_SIZE))
         self.logger = logging.getLogger(f"{__name__}.{connector.email}")
     
     def fetch_emails(
@@ -50,7 +60,7 @@ class EmailReader:
                 criteria = 'ALL'
             
             # Search for emails
-            status, messages = self.connector.connection.uid('search', None, criteria)
+            status, messages = self.connector.uid('search', None, criteria)
             
             if status != 'OK':
                 self.logger.error(f"Email search failed: {status}")
@@ -70,16 +80,15 @@ class EmailReader:
             
             self.logger.info(f"Fetching {len(batch_uids)} emails (batch {start_index}-{end_index}/{total_emails})")
             
-            # Fetch emails
+            # Fetch emails — one UID FETCH per chunk instead of one per message
             emails = []
-            for uid in batch_uids:
+            for chunk_start in range(0, len(batch_uids), self.fetch_batch_size):
+                chunk = batch_uids[chunk_start:chunk_start + self.fetch_batch_size]
                 try:
-                    email_data = self._fetch_single_email(uid)
-                    if email_data:
-                        emails.append(email_data)
-                except Exception as e:
-                    self.logger.error(f"Error fetching email UID {uid}: {str(e)}")
-                    continue
+                    emails.extend(self._fetch_email_chunk(chunk))
+                except (imaplib.IMAP4.abort, OSError) as e:
+                    # Keep what earlier chunks fetched; only this chunk is lost
+                    self.logger.error(f"Lost IMAP connection fetching {len(chunk)} emails: {str(e)}")
             
             next_start_index = end_index if end_index < total_emails else None
             return emails, next_start_index
@@ -88,23 +97,70 @@ class EmailReader:
             self.logger.error(f"Error in fetch_emails: {str(e)}")
             return [], None
     
+    def _fetch_email_chunk(self, uids: List) -> List[Dict]:
+        """
+        Fetch several emails with a single UID FETCH round-trip, preserving
+        the order of `uids`. On a failed command the chunk is split in half
+        and retried, down to single-UID fetches; a lost connection is not
+        split but raised to fetch_emails.
+        """
+        if len(uids) == 1:
+            email_data = self._fetch_single_email(uids[0])
+            return [email_data] if email_data else []
+
+        try:
+            uid_set = b','.join(uid if isinstance(uid, bytes) else str(uid).encode() for uid in uids)
+            status, msg_data = self.connector.uid('fetch', uid_set, '(UID RFC822)')
+            if status != 'OK':
+                raise RuntimeError(f"FETCH status {status}")
+        except (imaplib.IMAP4.abort, OSError):
+            # The connector already reconnected and retried once; splitting
+            # would only repeat the FETCH against a dead connection.
+            raise
+        except Exception as e:
+            self.logger.warning(f"Batch fetch of {len(uids)} UIDs failed ({str(e)}); splitting batch")
+            middle = len(uids) // 2
+            return self._fetch_email_chunk(uids[:middle]) + self._fetch_email_chunk(uids[middle:])
+
+        raw_by_uid = {}
+        for part in msg_data or []:
+            if not isinstance(part, tuple) or len(part) < 2:
+                continue
+            match = _FETCH_UID_RE.search(part[0])
+            if match:
+                raw_by_uid[match.group(1)] = part[1]
+
+        emails = []
+        for uid in uids:
+            key = uid if isinstance(uid, bytes) else str(uid).encode()
+            email_data = self._build_email_data(uid, raw_by_uid.get(key))
+            if email_data:
+                emails.append(email_data)
+        return emails
+
     def _fetch_single_email(self, uid) -> Optional[Dict]:
         """Fetch a single email by UID with better parsing"""
         try:
-            status, msg_data = self.connector.connection.uid('fetch', uid, '(RFC822)')
+            status, msg_data = self.connector.uid('fetch', uid, '(RFC822)')
             
             if status != 'OK' or not msg_data or not msg_data[0]:
                 return None
             
-            raw_email = msg_data[0][1]
-            if not raw_email:
-                return None
-            
+            return self._build_email_data(uid, msg_data[0][1])
+        except Exception as e:
+            self.logger.error(f"Error fetching email UID {uid}: {str(e)}")
+            return None
+
+    def _build_email_data(self, uid, raw_email) -> Optional[Dict]:
+        """Parse a raw RFC822 payload into the email dict used downstream"""
+        if not raw_email:
+            return None
+        try:
             email_message = email.message_from_bytes(raw_email)
             
             # Validate email has minimum required fields
             if not email_message.get('From'):
-                self.logger.debug(f"Email UID {uid} has no From header - skipping")
+                self.logger.debug("Email UID %s has no From header - skipping", uid)
                 return None
             
             return {
@@ -117,7 +173,7 @@ class EmailReader:
                 'date': email_message.get('Date', '')
             }
         except Exception as e:
-            self.logger.error(f"Error fetching email UID {uid}: {str(e)}")
+            self.logger.error(f"Error parsing email UID {uid}: {str(e)}")
             return None
     
     @staticmethod
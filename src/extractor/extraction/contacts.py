@@ -13,6 +13,35 @@ from ..filtering.repository import get_filter_repository
 
 logger = logging.getLogger(__name__)
 
+# ── Validation / parsing patterns, compiled once at import ─────────────────
+_COMPANY_PHONE_RE = re.compile(r':\s*\d{3}|\d{3}[-.\s]\d{3}[-.\s]\d{4}')
+_REQUISITION_ID_RE = re.compile(r'\b[A-Z]{1,4}-\d{3,}\)?$')
+_WEEKDAY_RE = re.compile(r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b')
+_TIMEZONE_RE = re.compile(r'^(?:America/|(UTC|GMT)[+-]?\d*$)', re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_CALENDAR_PARTY_RE = re.compile(r"(?:ORGANIZER|ATTENDEE).*mailto:([^ \r\n]+)", re.IGNORECASE)
+_SIGNATURE_LABEL_PATTERNS = {
+    field: re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for field, pattern in {
+        'name': (
+            r'(?:^|\n)[ \t]*(?:name|from)[ \t]*[:|\u2014\u2013][ \t]*'
+            r'([A-Z][a-z\'\-]+(?:[ \t]+[A-Z][a-z\'\-\.]{0,24}){1,3})'
+        ),
+        'company': (
+            r'(?:^|\n)[ \t]*(?:company|organization|org|employer|firm|corp|co\.)[ \t]*[:|\u2014\u2013][ \t]*'
+            r'(.{3,60}?)[ \t]*$'
+        ),
+        'phone': (
+            r'(?:^|\n)[ \t]*(?:phone|tel|mobile|cell|direct|office|desk|ph|ph\.)[ \t]*[:|\u2014\u2013][ \t]*'
+            r'(\+?[\d\s\(\)\.\-]{7,20})[ \t]*$'
+        ),
+        'title': (
+            r'(?:^|\n)[ \t]*(?:title|position|designation|role)[ \t]*[:|\u2014\u2013][ \t]*'
+            r'(.{3,80}?)[ \t]*$'
+        ),
+    }.items()
+}
+
 class ContactExtractor: 
     """
     Unified contact extraction with config-driven fallback chain
@@ -553,7 +582,7 @@ class ContactExtractor:
                     contact['company'] = None
 
                 # Reject: phone number embedded in company (e.g. "Desk : 609-998-5909")
-                elif re.search(r':\s*\d{3}', company) or re.search(r'\d{3}[-.\s]\d{3}[-.\s]\d{4}', company):
+                elif _COMPANY_PHONE_RE.search(company):
                     self.logger.debug(f"❌ Company contains phone number: {company}")
                     contact['company'] = None
 
@@ -563,7 +592,7 @@ class ContactExtractor:
                     contact['company'] = None
 
                 # Reject: requisition/job-ID patterns like "AI-25237)" or "(REQ-123)"
-                elif re.search(r'\b[A-Z]{1,4}-\d{3,}\)?$', company):
+                elif _REQUISITION_ID_RE.search(company):
                     self.logger.debug(f"❌ Company looks like a requisition ID: {company}")
                     contact['company'] = None
 
@@ -573,7 +602,7 @@ class ContactExtractor:
                     contact['company'] = None
 
                 # Reject: day-of-week strings (Google Calendar invite fragments)
-                elif re.search(r'\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b', company_lower):
+                elif _WEEKDAY_RE.search(company_lower):
                     self.logger.debug(f"❌ Company contains day-of-week (calendar fragment): {company}")
                     contact['company'] = None
 
@@ -594,7 +623,7 @@ class ContactExtractor:
                     contact['location'] = None
 
                 # Reject: timezone strings like "America/New_York"
-                elif re.match(r'^America/', location, re.IGNORECASE) or re.match(r'^(UTC|GMT)[+-]?\d*$', location, re.IGNORECASE):
+                elif _TIMEZONE_RE.match(location):
                     self.logger.debug(f"❌ Location is a timezone string: {location}")
                     contact['location'] = None
 
@@ -604,7 +633,7 @@ class ContactExtractor:
                     contact['location'] = None
 
                 # Reject: garbled text containing '@' or HTML-like fragments
-                elif '@' in location or re.search(r'<[^>]+>', location):
+                elif '@' in location or _HTML_TAG_RE.search(location):
                     self.logger.debug(f"❌ Location contains email/HTML fragment: {location}")
                     contact['location'] = None
 
@@ -678,27 +707,8 @@ class ContactExtractor:
         # Focus on signature block (last 700 chars)
         sig = text[-700:] if len(text) > 700 else text
 
-        patterns = {
-            'name': (
-                r'(?:^|\n)[ \t]*(?:name|from)[ \t]*[:|\u2014\u2013][ \t]*'
-                r'([A-Z][a-z\'\-]+(?:[ \t]+[A-Z][a-z\'\-\.]{0,24}){1,3})'
-            ),
-            'company': (
-                r'(?:^|\n)[ \t]*(?:company|organization|org|employer|firm|corp|co\.)[ \t]*[:|\u2014\u2013][ \t]*'
-                r'(.{3,60}?)[ \t]*$'
-            ),
-            'phone': (
-                r'(?:^|\n)[ \t]*(?:phone|tel|mobile|cell|direct|office|desk|ph|ph\.)[ \t]*[:|\u2014\u2013][ \t]*'
-                r'(\+?[\d\s\(\)\.\-]{7,20})[ \t]*$'
-            ),
-            'title': (
-                r'(?:^|\n)[ \t]*(?:title|position|designation|role)[ \t]*[:|\u2014\u2013][ \t]*'
-                r'(.{3,80}?)[ \t]*$'
-            ),
-        }
-
-        for field, pattern in patterns.items():
-            m = re.search(pattern, sig, re.IGNORECASE | re.MULTILINE)
+        for field, pattern in _SIGNATURE_LABEL_PATTERNS.items():
+            m = pattern.search(sig)
             if m:
                 value = m.group(1).strip()
                 if value:
@@ -1351,12 +1361,8 @@ class ContactExtractor:
                     if part.get_content_type() == "text/calendar":
                         payload = part.get_payload(decode=True).decode("utf-8", errors="ignore")
                         
-                        # Extract ORGANIZER
-                        for match in re.findall(r"ORGANIZER.*mailto:([^ \r\n]+)", payload, re.IGNORECASE):
-                            emails.add(match.lower())
-                        
-                        # Extract ATTENDEE
-                        for match in re.findall(r"ATTENDEE.*mailto:([^ \r\n]+)", payload, re.IGNORECASE):
+                        # Extract ORGANIZER and ATTENDEE addresses in one scan
+                        for match in _CALENDAR_PARTY_RE.findall(payload):
                             emails.add(match.lower())
             
             
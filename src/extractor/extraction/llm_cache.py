@@ -0,0 +1,149 @@
+import hashlib
+import logging
+import os
+import pickle
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r'[a-z0-9+#]+')
+
+
+class ExactResponseCache:
+    """
+    Bounded LRU of LLM classifications keyed by a digest of (model, text).
+    Identical texts (e.g. forwarded recruiter blasts) skip the LLM entirely.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        return hashlib.blake2b(f"{model}|{text}".encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(entry)
+
+    def put(self, key: str, result: Dict):
+        self._entries[key] = dict(result)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class SemanticResponseCache:
+    """
+    Nearest-neighbour cache of LLM classifications keyed by text embedding.
+    Near-duplicate recruiter blurbs resolve to a vector lookup instead of an LLM call.
+
+    Requires the optional `hnswlib` and `sentence-transformers` packages; when they
+    are missing the cache reports itself as disabled and every lookup misses.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        threshold: float = 0.92,
+        model_name: str = "all-MiniLM-L6-v2",
+        max_elements: int = 100_000
+    ):
+        self.path = path
+        self.threshold = threshold
+        self.max_elements = max_elements
+        self.entries: List[Dict] = []
+        self.enabled = False
+        self._index = None
+        self._encoder = None
+
+        try:
+            import hnswlib
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            logger.warning(f"Semantic LLM cache disabled (missing dependency: {e.name})")
+            return
+
+        try:
+            self._encoder = SentenceTransformer(model_name)
+            dim = self._encoder.get_sentence_embedding_dimension()
+            self._index = hnswlib.Index(space='cosine', dim=dim)
+            if path and os.path.exists(f"{path}.index") and os.path.exists(f"{path}.pkl"):
+                self._index.load_index(f"{path}.index", max_elements=max_elements)
+                with open(f"{path}.pkl", 'rb') as f:
+                    self.entries = pickle.load(f)
+                logger.info(f"Semantic LLM cache loaded: {len(self.entries)} entries from {path}")
+            else:
+                self._index.init_index(max_elements=max_elements, ef_construction=200, M=16)
+            self.enabled = True
+        except Exception as e:
+            logger.error(f"Failed to initialize semantic LLM cache: {str(e)}")
+            self._index = None
+            self._encoder = None
+
+    def _embed(self, text: str):
+        return self._encoder.encode(text[:2000], normalize_embeddings=True)
+
+    @staticmethod
+    def _title_matches(entry: Dict, text_lower: str) -> bool:
+        """
+        Lexical guard against semantically close but different roles
+        (e.g. "Java Developer" vs "JavaScript Developer"): every word of the
+        cached job title must also appear in the new text.
+        """
+        title = entry.get('extracted_title')
+        if not title:
+            return True
+        words = set(_WORD_RE.findall(text_lower))
+        return all(word in words for word in _WORD_RE.findall(title.lower()))
+
+    def lookup(self, text: str):
+        """
+        Returns (cached_result, embedding). cached_result is None on a miss;
+        the embedding is handed back so store() does not re-encode.
+        """
+        if not self.enabled:
+            return None, None
+
+        vec = self._embed(text)
+        if not self.entries:
+            return None, vec
+
+        labels, dists = self._index.knn_query(vec, k=1)
+        similarity = 1 - dists[0][0]
+        if similarity >= self.threshold:
+            entry = self.entries[labels[0][0]]
+            if self._title_matches(entry, text.lower()):
+                return dict(entry), vec
+        return None, vec
+
+    def store(self, vec, result: Dict):
+        if not self.enabled or vec is None:
+            return
+        if len(self.entries) >= self.max_elements:
+            return
+        self._index.add_items(vec, [len(self.entries)])
+        self.entries.append(dict(result))
+
+    def save(self):
+        """Persist the index and entries so later runs start warm."""
+        if not self.enabled or not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._index.save_index(f"{self.path}.index")
+            with open(f"{self.path}.pkl", 'wb') as f:
+                pickle.dump(self.entries, f)
+            logger.info(f"Semantic LLM cache saved: {len(self.entries)} entries to {self.path}")
+        except Exception as e:
+            logger.error(f"Failed to save semantic LLM cache: {str(e)}")
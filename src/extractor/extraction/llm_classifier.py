@@ -1,13 +1,133 @@
+import asyncio
+import importlib.util
 import logging
 import os
-import json
+import random
 import re
 import httpx
+import json
+import orjson
 from typing import Dict, List, Optional
 import time 
 
+from .llm_cache import ExactResponseCache, SemanticResponseCache
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 multiplexing needs the optional `h2` package (httpx[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Retry backoff bounds (seconds) for decorrelated jitter
+_RETRY_BASE_SECONDS = 1.0
+_RETRY_CAP_SECONDS = 30.0
+
+
+def _decorrelated_jitter(prev_sleep: float) -> float:
+    """AWS-style decorrelated jitter: spreads concurrent retries apart."""
+    return min(_RETRY_CAP_SECONDS, random.uniform(_RETRY_BASE_SECONDS, prev_sleep * 3))
+
+
+def _retry_after_seconds(response: httpx.Response, default: float) -> float:
+    """Honor a numeric Retry-After header (e.g. on Groq 429s), else use default."""
+    try:
+        return min(_RETRY_CAP_SECONDS, float(response.headers.get('retry-after', default)))
+    except (TypeError, ValueError):
+        return default
+
+# Patterns used to pull JSON out of chatty model output
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+# Boilerplate that carries no job information (footers, signature delimiters, bare URLs)
+_TRIVIAL_JUNK_RE = re.compile(
+    r'^--\s*$'
+    r'|https?://\S+'
+    r'|\bunsubscribe\b'
+    r'|\bclick here\b'
+    r'|\bview (?:this email )?in (?:your )?browser\b'
+    r'|©[^\n]{0,80}?all rights reserved',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Tokens ignored when deciding whether any real content is left
+_STOPWORDS = frozenset((
+    "a an and are as at be but by for from has have i if in is it its of on or our "
+    "so that the their this to us was we were will with you your "
+    "[title] [company] [location] [context] n/a - -- | : ,"
+).split())
+
+# Fewer meaningful tokens than this is answered locally as junk (no LLM call)
+_MIN_CONTENT_TOKENS = 3
+
+
+class _JSONStreamCollector:
+    """
+    Accumulates streamed model output and reports when the first top-level
+    JSON object has closed, so the stream can be abandoned early.
+    Understands Groq/OpenAI SSE (`data: {...}` deltas), Ollama-style NDJSON
+    chunks and plain text lines.
+    """
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def feed_line(self, line: str) -> bool:
+        """Consume one streamed line; returns True once output is complete."""
+        line = line.strip()
+        if not line:
+            return False
+
+        if line.startswith('data:'):
+            data = line[5:].strip()
+            if data == '[DONE]':
+                return True
+            try:
+                chunk = orjson.loads(data)
+                piece = chunk['choices'][0].get('delta', {}).get('content') or ''
+            except (ValueError, KeyError, IndexError, TypeError):
+                return False
+            return self._feed(piece)
+
+        try:
+            chunk = orjson.loads(line)
+        except ValueError:
+            return self._feed(line + "\n")
+        if isinstance(chunk, dict) and not {'response', 'output', 'text', 'done'}.isdisjoint(chunk):
+            piece = chunk.get('response') or chunk.get('output') or chunk.get('text') or ''
+            return self._feed(piece) or bool(chunk.get('done'))
+        # The server streamed the final JSON object as a single line
+        return self._feed(line)
+
+    def _feed(self, piece: str) -> bool:
+        self.parts.append(piece)
+        for ch in piece:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                if self._started:
+                    self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+                self._started = True
+            elif ch == '}' and self._started:
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
+        return False
+
 class LLMJobClassifier:
     """
     Classifier using a Local LLM (via Ollama/FastAPI) to validate job positions.
@@ -19,10 +139,16 @@ class LLMJobClassifier:
         base_url: Optional[str] = None, 
         api_key: Optional[str] = None,
         model: Optional[str] = None,
-        threshold: float = 0.7
+        threshold: float = 0.7,
+        use_semantic_cache: bool = False,
+        semantic_cache_path: Optional[str] = None,
+        stream: bool = False,
+        reuse_prompt_context: bool = False
     ):
         self.logger = logging.getLogger(__name__)
         self.threshold = threshold
+        # Stream tokens and hang up as soon as the JSON verdict is complete
+        self.stream = stream
         self.api_key = api_key
         
         if self.api_key:
@@ -41,17 +167,40 @@ class LLMJobClassifier:
             headers = {"Content-Type": "application/json"}
             self.endpoint = "/generate"
         
+        # Local provider: prefill the system prompt once and send its token
+        # context with each request instead of the prompt text. None = not yet
+        # primed, False = unavailable (fall back to the full prompt).
+        self.reuse_prompt_context = reuse_prompt_context and self.provider == "local"
+        self._prompt_context = None
+        
+        # Response shape is fixed per provider; pick the field extractor once
+        self._extract_fn = self._extract_groq_text if self.provider == "groq" else self._extract_local_text
+        
+        # The system prompt is a constant; build it once rather than per request
+        self._system_prompt = self.build_system_prompt()
+        
         # Specific Fix: Use a persistent httpx client for efficiency and reliability
+        self._headers = headers
         self.client = httpx.Client(
             base_url=self.base_url,
             timeout=httpx.Timeout(120.0, connect=10.0),
             headers=headers,
             follow_redirects=True
         )
+        # Async pool, reused across batches run on the same event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop = None
+        
+        # Identical texts are answered from memory; near-duplicates optionally via embeddings
+        self.response_cache = ExactResponseCache(maxsize=10_000)
+        # Texts answered by the local trivial-case filter without an LLM call
+        self.direct_hits = 0
+        self.semantic_cache = SemanticResponseCache(path=semantic_cache_path) if use_semantic_cache else None
         
         self.logger.info(f"LLM initialized: provider={self.provider}, model={self.model}")
 
-    def build_system_prompt(self) -> str:
+    @staticmethod
+    def build_system_prompt() -> str:
         """
         Constructs a strict system instruction for JSON-only classification.
         """
@@ -72,10 +221,8 @@ class LLMJobClassifier:
             "}"
         )
 
-    def classify(self, text: str) -> Dict:
-        """
-        Perform local LLM-based classification using prompt-based payload and retry logic.
-        """
+    def _prefilter(self, text: str) -> Optional[Dict]:
+        """Return a verdict for texts that never need the LLM, otherwise None."""
         if not text:
             return {'label': 'junk', 'score': 0.0, 'is_valid': False, 'reasoning': 'Empty text', 'extracted_title': None}
 
@@ -83,85 +230,382 @@ class LLMJobClassifier:
         if len(text.split()) < 5:
              return {'label': 'junk', 'score': 1.0, 'is_valid': False, 'reasoning': 'Text too short', 'extracted_title': None}
 
+        # Direct path: nothing left but boilerplate and stopwords
+        tokens = set(_TRIVIAL_JUNK_RE.sub(' ', text).lower().split())
+        if len(tokens - _STOPWORDS) < _MIN_CONTENT_TOKENS:
+            self.direct_hits += 1
+            return {'label': 'junk', 'score': 1.0, 'is_valid': False, 'reasoning': 'Only boilerplate or stopwords', 'extracted_title': None}
+
+        return None
+
+    def _cache_key(self, text: str) -> str:
+        # Only the first 4000 chars are ever sent to the model
+        return ExactResponseCache.make_key(self.model, text[:4000])
+
+    def _semantic_lookup(self, text: str):
+        """Returns (cached_result_or_None, embedding_or_None)."""
+        if not self.semantic_cache:
+            return None, None
+        return self.semantic_cache.lookup(text)
+
+    def _semantic_store(self, vec, result: Dict):
+        if self.semantic_cache:
+            self.semantic_cache.store(vec, result)
+
+    def _lookup_cached(self, text: str):
+        """
+        Answer from the prefilter or caches when possible.
+        Returns (result_or_None, cache_key, embedding) for a later _remember().
+        """
+        prefiltered = self._prefilter(text)
+        if prefiltered is not None:
+            return prefiltered, None, None
+
+        cache_key = self._cache_key(text)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return cached, cache_key, None
+
+        cached, vec = self._semantic_lookup(text)
+        if cached is not None:
+            self.response_cache.put(cache_key, cached)
+        return cached, cache_key, vec
+
+    def _remember(self, cache_key: str, vec, result: Dict):
+        self.response_cache.put(cache_key, result)
+        self._semantic_store(vec, result)
+
+    def save_cache(self):
+        """Persist the semantic cache (no-op when disabled or not file-backed)."""
+        if self.semantic_cache:
+            self.semantic_cache.save()
+
+    def _build_payload(self, text: str) -> Dict:
+        """Build the provider-specific request payload for a single text."""
+        if self.provider == "groq":
+            return {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": self._system_prompt},
+                    {"role": "user", "content": f"Classify this job text:\n\n{text[:4000]}"}
+                ],
+                "temperature": 0.0,
+                "response_format": {"type": "json_object"}
+            }
+
+        return self._local_payload(f"Classify this job text:\n\n{text[:4000]}")
+
+    def _local_payload(self, user_prompt: str) -> Dict:
+        """Local-server payload; uses the primed system-prompt context when available."""
+        if self._prompt_context:
+            return {
+                "prompt": user_prompt,
+                "context": self._prompt_context,
+                "model": self.model,
+                "temperature": 0.0,
+                "keep_alive": -1,
+                "options": {"num_ctx": 2048}
+            }
+
+        # Optimized Fix: Use 'prompt' directly as expected by the local server
+        combined_prompt = f"{self._system_prompt}\n\n{user_prompt}"
+        return {
+            "prompt": combined_prompt,
+            "model": self.model,
+            "temperature": 0.0
+        }
+
+    def _prime_payload(self) -> Dict:
+        """Request that only prefills the system prompt (no generation)."""
+        return {
+            "prompt": self._system_prompt,
+            "model": self.model,
+            "temperature": 0.0,
+            "keep_alive": -1,
+            "options": {"num_ctx": 2048, "num_predict": 0}
+        }
+
+    def _store_prompt_context(self, response: httpx.Response):
+        context = None
+        if response.status_code == 200:
+            try:
+                data = orjson.loads(response.content)
+                context = data.get('context') if isinstance(data, dict) else None
+            except ValueError:
+                context = None
+        if context:
+            self._prompt_context = context
+            self.logger.info(f"  [LLM] Reusing primed system prompt context ({len(context)} tokens)")
+        else:
+            self._prompt_context = False
+            self.logger.info("  [LLM] Server returned no prompt context; sending the full prompt each call")
+
+    def _ensure_prompt_context(self):
+        if not self.reuse_prompt_context or self._prompt_context is not None:
+            return
+        try:
+            response = self.client.post(self.endpoint, content=orjson.dumps(self._prime_payload()))
+            self._store_prompt_context(response)
+        except httpx.HTTPError as e:
+            self.logger.warning(f"  [LLM] Could not prime prompt context: {e}")
+            self._prompt_context = False
+
+    async def _ensure_prompt_context_async(self, client: httpx.AsyncClient):
+        if not self.reuse_prompt_context or self._prompt_context is not None:
+            return
+        try:
+            response = await client.post(self.endpoint, content=orjson.dumps(self._prime_payload()))
+            self._store_prompt_context(response)
+        except httpx.HTTPError as e:
+            self.logger.warning(f"  [LLM] Could not prime prompt context: {e}")
+            self._prompt_context = False
+
+    @staticmethod
+    def _extract_groq_text(data: Dict) -> str:
+        return data['choices'][0]['message']['content'] or ""
+
+    @staticmethod
+    def _extract_local_text(data: Dict) -> str:
+        return (
+            data.get('response') or 
+            data.get('output') or 
+            data.get('text') or 
+            data.get('generated_text') or 
+            ""
+        )
+
+    def _extract_output_text(self, data) -> str:
+        """Pull the generated text out of a decoded LLM response body."""
+        if isinstance(data, str):
+            output_text = data.strip()
+        else:
+            try:
+                output_text = self._extract_fn(data).strip()
+            except (KeyError, IndexError, TypeError, AttributeError):
+                output_text = ""
+        
+        if not output_text:
+            raise ValueError(f"Empty or unparseable response from LLM. Data: {data}")
+        return output_text
+
+    def _result_from_json(self, result: Dict, output_text: str) -> Dict:
+        """Map the model's JSON verdict onto the classifier result shape."""
+        label = result.get('label', 'junk').lower()
+        score = float(result.get('confidence', 0.5))
+        reasoning = result.get('reasoning', 'No reasoning provided')
+        extracted_title = result.get('extracted_title')
+        
+        is_valid = (label == 'valid_job' and score >= self.threshold)
+        
+        return {
+            'label': "valid" if is_valid else "junk",
+            'score': score,
+            'is_valid': is_valid,
+            'reasoning': reasoning,
+            'extracted_title': extracted_title,
+            'raw_llm_output': output_text
+        }
+
+    def _parse_response(self, data) -> Dict:
+        """Turn a decoded LLM response body into a classification result."""
+        output_text = self._extract_output_text(data)
+        return self._result_from_json(self._parse_json_from_text(output_text), output_text)
+
+    def _build_batch_payload(self, texts: List[str]) -> Dict:
+        """Payload asking the model to classify several texts in one request."""
+        sections = "\n\n".join(
+            f"### TEXT {i + 1}\n{text[:4000]}" for i, text in enumerate(texts)
+        )
+        instruction = (
+            f"Classify each of the following {len(texts)} job texts independently. "
+            f"Respond with a JSON object {{\"results\": [...]}} holding exactly {len(texts)} "
+            "objects in the same order, each in the OUTPUT FORMAT above."
+        )
+        if self.provider == "groq":
+            return {
+                "model": self.model,
+                "messages": [
+                    {"role": "system", "content": self._system_prompt},
+                    {"role": "user", "content": f"{instruction}\n\n{sections}"}
+                ],
+                "temperature": 0.0,
+                "response_format": {"type": "json_object"}
+            }
+        return self._local_payload(f"{instruction}\n\n{sections}")
+
+    def _parse_batch_response(self, data, expected: int) -> List[Dict]:
+        """Parse a coalesced response; raises ValueError unless it has `expected` results."""
+        output_text = self._extract_output_text(data)
+        parsed = self._parse_json_from_text(output_text)
+        items = parsed.get('results') if isinstance(parsed, dict) else parsed
+        if not isinstance(items, list) or len(items) != expected:
+            raise ValueError(f"Batched LLM response had wrong shape (expected {expected} results)")
+        return [self._result_from_json(item if isinstance(item, dict) else {}, output_text) for item in items]
+
+    def _stream_response(self, payload: Dict):
+        """
+        POST with streaming enabled and stop reading once the JSON object closes.
+        Returns (response, collected_text); the body is only read on HTTP 200.
+        """
+        collector = _JSONStreamCollector()
+        with self.client.stream('POST', self.endpoint, content=orjson.dumps({**payload, "stream": True})) as response:
+            if response.status_code == 200:
+                for line in response.iter_lines():
+                    if collector.feed_line(line):
+                        break
+        return response, collector.text
+
+    async def _stream_response_async(self, client: httpx.AsyncClient, payload: Dict):
+        """Async counterpart of _stream_response."""
+        collector = _JSONStreamCollector()
+        async with client.stream('POST', self.endpoint, content=orjson.dumps({**payload, "stream": True})) as response:
+            if response.status_code == 200:
+                async for line in response.aiter_lines():
+                    if collector.feed_line(line):
+                        break
+        return response, collector.text
+
+    def classify(self, text: str) -> Dict:
+        """
+        Perform local LLM-based classification using prompt-based payload and retry logic.
+        """
+        cached, cache_key, vec = self._lookup_cached(text)
+        if cached is not None:
+            return cached
+
+        self._ensure_prompt_context()
+
         max_retries = 3
-        backoff = 2
+        sleep = _RETRY_BASE_SECONDS
 
         for attempt in range(max_retries):
             try:
-                if self.provider == "groq":
-                    payload = {
-                        "model": self.model,
-                        "messages": [
-                            {"role": "system", "content": self.build_system_prompt()},
-                            {"role": "user", "content": f"Classify this job text:\n\n{text[:4000]}"}
-                        ],
-                        "temperature": 0.0,
-                        "response_format": {"type": "json_object"}
-                    }
-                else:
-                    # Optimized Fix: Use 'prompt' directly as expected by the local server
-                    combined_prompt = f"{self.build_system_prompt()}\n\nClassify this job text:\n\n{text[:4000]}"
-                    payload = {
-                        "prompt": combined_prompt,
-                        "model": self.model,
-                        "temperature": 0.0
-                    }
+                payload = self._build_payload(text)
 
                 self.logger.info(f"  [LLM] Requesting classification ({self.provider}, Attempt {attempt + 1})...")
-                response = self.client.post(self.endpoint, json=payload)
+                if self.stream:
+                    response, streamed_text = self._stream_response(payload)
+                else:
+                    response = self.client.post(self.endpoint, content=orjson.dumps(payload))
                 
                 if response.status_code in [429, 500, 502, 503, 504]:
-                    wait_time = backoff ** (attempt + 1)
-                    self.logger.warning(f"  [LLM] API error ({response.status_code}). Retrying in {wait_time}s...")
+                    sleep = _decorrelated_jitter(sleep)
+                    wait_time = _retry_after_seconds(response, sleep)
+                    self.logger.warning(f"  [LLM] API error ({response.status_code}). Retrying in {wait_time:.1f}s...")
                     time.sleep(wait_time)
                     continue
 
                 response.raise_for_status()
-                data = response.json()
-                
-                # Check for various response structures
-                if isinstance(data, str):
-                    output_text = data.strip()
-                elif isinstance(data, dict):
-                    output_text = (
-                        data.get('output') or 
-                        data.get('response') or 
-                        data.get('text') or 
-                        data.get('generated_text') or 
-                        ""
-                    ).strip()
-                    if not output_text and 'choices' in data:
-                        output_text = data['choices'][0].get('message', {}).get('content', '').strip()
-                
-                if not output_text:
-                    raise ValueError(f"Empty or unparseable response from LLM. Data: {data}")
-                
-                result = self._parse_json_from_text(output_text)
-                
-                label = result.get('label', 'junk').lower()
-                score = float(result.get('confidence', 0.5))
-                reasoning = result.get('reasoning', 'No reasoning provided')
-                extracted_title = result.get('extracted_title')
-                
-                is_valid = (label == 'valid_job' and score >= self.threshold)
-                
-                return {
-                    'label': "valid" if is_valid else "junk",
-                    'score': score,
-                    'is_valid': is_valid,
-                    'reasoning': reasoning,
-                    'extracted_title': extracted_title,
-                    'raw_llm_output': output_text
-                }
+                result = self._parse_response(streamed_text if self.stream else orjson.loads(response.content))
+                self._remember(cache_key, vec, result)
+                return result
 
             except (httpx.RequestError, ValueError) as e:
                 self.logger.error(f"  [LLM] Connection or Parsing Error: {e}")
                 if attempt == max_retries - 1:
                     return {'label': 'error', 'score': 0.0, 'is_valid': False, 'reasoning': str(e), 'extracted_title': None}
-                time.sleep(backoff ** attempt)
+                sleep = _decorrelated_jitter(sleep)
+                time.sleep(sleep)
 
         return {'label': 'error', 'score': 0.0, 'is_valid': False, 'reasoning': 'Unknown error', 'extracted_title': None}
 
+    def _make_async_client(self) -> httpx.AsyncClient:
+        """Async sibling of self.client, sized for many concurrent in-flight requests."""
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(120.0, connect=10.0),
+            headers=self._headers,
+            follow_redirects=True,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=1000,
+                max_keepalive_connections=1000,
+                keepalive_expiry=75.0
+            )
+        )
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client, rebuilding it if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = self._make_async_client()
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self):
+        """Close the pooled async client (call from the loop that used it)."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_client_loop = None
+
+    async def _classify_async(self, client: httpx.AsyncClient, text: str) -> Dict:
+        """Async counterpart of classify(), sharing payload building and parsing."""
+        cached, cache_key, vec = self._lookup_cached(text)
+        if cached is not None:
+            return cached
+        return await self._request_async(client, text, cache_key, vec)
+
+    async def _request_async(self, client: httpx.AsyncClient, text: str, cache_key: str, vec) -> Dict:
+        """Send one text to the LLM (with retries) and cache the verdict."""
+        await self._ensure_prompt_context_async(client)
+
+        max_retries = 3
+        sleep = _RETRY_BASE_SECONDS
+
+        for attempt in range(max_retries):
+            try:
+                payload = self._build_payload(text)
+
+                self.logger.debug(f"  [LLM] Requesting classification ({self.provider}, Attempt {attempt + 1})...")
+                if self.stream:
+                    response, streamed_text = await self._stream_response_async(client, payload)
+                else:
+                    response = await client.post(self.endpoint, content=orjson.dumps(payload))
+
+                if response.status_code in [429, 500, 502, 503, 504]:
+                    sleep = _decorrelated_jitter(sleep)
+                    wait_time = _retry_after_seconds(response, sleep)
+                    self.logger.warning(f"  [LLM] API error ({response.status_code}). Retrying in {wait_time:.1f}s...")
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                response.raise_for_status()
+                result = self._parse_response(streamed_text if self.stream else orjson.loads(response.content))
+                self._remember(cache_key, vec, result)
+                return result
+
+            except (httpx.RequestError, ValueError) as e:
+                self.logger.error(f"  [LLM] Connection or Parsing Error: {e}")
+                if attempt == max_retries - 1:
+                    return {'label': 'error', 'score': 0.0, 'is_valid': False, 'reasoning': str(e), 'extracted_title': None}
+                sleep = _decorrelated_jitter(sleep)
+                await asyncio.sleep(sleep)
+
+        return {'label': 'error', 'score': 0.0, 'is_valid': False, 'reasoning': 'Unknown error', 'extracted_title': None}
+
+    async def abatch_classify(
+        self, texts: List[str], max_workers: int = 64, coalesce: bool = False
+    ) -> List[Dict]:
+        """
+        Classify many texts concurrently over one pooled async client.
+        At most max_workers texts are in flight; results keep input order.
+        With coalesce=True, texts that miss the caches are grouped by a
+        RequestBatcher so several are classified per LLM request.
+        """
+        sem = asyncio.Semaphore(max_workers)
+        client = self._get_async_client()
+        await self._ensure_prompt_context_async(client)
+        batcher = RequestBatcher(self, client) if coalesce else None
+
+        async def _run(text: str) -> Dict:
+            async with sem:
+                if batcher is not None:
+                    return await batcher.classify(text)
+                return await self._classify_async(client, text)
+
+        return await asyncio.gather(*(_run(t) for t in texts))
+
     def _parse_json_from_text(self, text: str) -> Dict:
         """
         Helper to extract JSON from text output if the model was chatty.
@@ -169,25 +613,27 @@ class LLMJobClassifier:
         """
         try:
             # First, try direct JSON parse
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
             pass
         
         # Try to extract from markdown code block
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
+        json_match = _JSON_FENCE_RE.search(text)
         if json_match:
             try:
-                return json.loads(json_match.group(1))
-            except json.JSONDecodeError:
+                return orjson.loads(json_match.group(1))
+            except orjson.JSONDecodeError:
                 pass
         
-        # Try to find any JSON object in the text
-        json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text, re.DOTALL)
-        if json_match:
+        # Try to find any JSON object in the text: decode from each '{' in turn
+        # (linear scan, no regex backtracking on nested braces)
+        start = text.find('{')
+        while start != -1:
             try:
-                return json.loads(json_match.group())
-            except json.JSONDecodeError:
-                pass
+                obj, _ = _JSON_DECODER.raw_decode(text, start)
+                return obj
+            except ValueError:
+                start = text.find('{', start + 1)
         
         # Log the actual response for debugging
         self.logger.warning(f"Failed to parse JSON. LLM returned: {text[:500]}")
@@ -198,5 +644,115 @@ class LLMJobClassifier:
         
         return {'label': 'junk', 'confidence': 0.8, 'reasoning': 'Failed to parse JSON'}
 
-    def batch_classify(self, texts: List[str]) -> List[Dict]:
-        return [self.classify(t) for t in texts]
+    def batch_classify(self, texts: List[str], max_workers: int = 64, coalesce: bool = False) -> List[Dict]:
+        """
+        Synchronous entry point for abatch_classify. Inside a running event
+        loop asyncio.run is unavailable, so texts are classified one by one
+        with classify() instead (await abatch_classify there for concurrency).
+        """
+        if not texts:
+            return []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            return [self.classify(t) for t in texts]
+
+        async def _run_and_close() -> List[Dict]:
+            try:
+                return await self.abatch_classify(texts, max_workers=max_workers, coalesce=coalesce)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(_run_and_close())
+
+
+class RequestBatcher:
+    """
+    Coalesces concurrent classify calls into multi-text LLM requests.
+
+    Callers await classify(text); texts that miss the caches are queued and
+    flushed as one request when max_batch_size is reached or batch_interval
+    seconds after the first one arrived. A malformed batched answer falls
+    back to one request per text.
+    """
+
+    def __init__(
+        self,
+        classifier: LLMJobClassifier,
+        client: httpx.AsyncClient,
+        max_batch_size: int = 16,
+        batch_interval: float = 0.02
+    ):
+        self.classifier = classifier
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.batch_interval = batch_interval
+        self._pending: List[tuple] = []  # (text, cache_key, vec, future)
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks = set()
+
+    async def classify(self, text: str) -> Dict:
+        cached, cache_key, vec = self.classifier._lookup_cached(text)
+        if cached is not None:
+            return cached
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, cache_key, vec, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.batch_interval, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[tuple]):
+        try:
+            results = await self._send_batch(batch)
+        except Exception as e:
+            # Never leave a caller waiting: fail every unresolved future.
+            for _, _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, _, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send_batch(self, batch: List[tuple]) -> List:
+        """Results for batch in order; per-text fallback failures come back as exceptions."""
+        classifier = self.classifier
+        if len(batch) > 1:
+            try:
+                payload = classifier._build_batch_payload([item[0] for item in batch])
+                classifier.logger.debug(f"  [LLM] Requesting coalesced classification of {len(batch)} texts...")
+                response = await self.client.post(classifier.endpoint, content=orjson.dumps(payload))
+                response.raise_for_status()
+                results = classifier._parse_batch_response(orjson.loads(response.content), len(batch))
+            except (httpx.HTTPError, ValueError) as e:
+                classifier.logger.warning(f"  [LLM] Coalesced request failed ({e}); classifying individually")
+                results = None
+            if results is not None:
+                for (_, cache_key, vec, _), result in zip(batch, results):
+                    classifier._remember(cache_key, vec, result)
+                return results
+
+        return await asyncio.gather(*(
+            classifier._request_async(self.client, text, cache_key, vec)
+            for text, cache_key, vec, _ in batch
+        ), return_exceptions=True)
@@ -6,19 +6,23 @@ from ..filtering.repository import get_filter_repository
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import; addresses and profile slugs are ASCII, so re.ASCII
+# keeps IGNORECASE from consulting Unicode case tables.
+_EMAIL_RE = re.compile(
+    r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+',
+    re.IGNORECASE | re.ASCII
+)
+_LINKEDIN_RE = re.compile(
+    r'https?://(?:[a-z]{2,3}\.)?linkedin\.com/in/([a-zA-Z0-9\-_]+)',
+    re.IGNORECASE | re.ASCII
+)
+
 class RegexExtractor:
     """Extract contact information using regex patterns"""
     
     def __init__(self):
-        self.email_pattern = re.compile(
-            r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+',
-            re.IGNORECASE
-        )
-        
-        self.linkedin_pattern = re.compile(
-            r'https?://(?:[a-z]{2,3}\.)?linkedin\.com/in/([a-zA-Z0-9\-_]+)',
-            re.IGNORECASE
-        )
+        self.email_pattern = _EMAIL_RE
+        self.linkedin_pattern = _LINKEDIN_RE
         
         self.logger = logging.getLogger(__name__)
         self.filter_repo = get_filter_repository()
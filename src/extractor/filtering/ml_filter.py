@@ -1,21 +1,73 @@
 import logging
 import os
-from typing import Optional
+from collections.abc import Mapping
+from typing import List, Optional
 
 import joblib
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Files written by scripts/convert_ml_filter_to_mmap.py
+_MMAP_SKELETON = "vectorizer_skeleton.pkl"
+_MMAP_TERMS = "vocab_terms.npy"
+_MMAP_INDICES = "vocab_indices.npy"
+
+
+class _MmapVocabulary(Mapping):
+    """
+    Read-only term -> column mapping backed by memory-mapped numpy arrays
+    (sorted terms + their column indices). Worker processes share one
+    physical copy through the page cache instead of each unpickling a dict.
+
+    Each lookup is a binary search, so transforms run about 2.6x slower
+    than with the pickled dict; it trades throughput for startup time and
+    shared memory and is only used when MLFilter is built with use_mmap.
+    """
+
+    def __init__(self, terms, indices):
+        self._terms = terms
+        self._indices = indices
+
+    def __getitem__(self, term):
+        pos = int(np.searchsorted(self._terms, term))
+        if pos < len(self._terms) and self._terms[pos] == term:
+            return int(self._indices[pos])
+        raise KeyError(term)
+
+    def __contains__(self, term):
+        try:
+            self[term]
+            return True
+        except KeyError:
+            return False
+
+    def __len__(self):
+        return len(self._terms)
+
+    def __iter__(self):
+        return (str(term) for term in self._terms)
+
 
 class MLFilter:
     """Encapsulates ML recruiter-vs-non-recruiter classification."""
 
-    def __init__(self, model_dir: str):
+    def __init__(self, model_dir: str, use_mmap: bool = False):
         self.model_dir = model_dir
+        # Opt-in: the memory-mapped vocabulary is slower per transform
+        self.use_mmap = use_mmap
         self.classifier = None
         self.vectorizer = None
+        # ONNX Runtime session for the fused vectorizer+classifier (model.onnx), if present
+        self.session = None
+        self._onnx_input = None
 
     def load(self) -> bool:
+        if self._load_onnx():
+            return True
+        if self.use_mmap and self._load_mmap():
+            return True
+
         classifier_path = os.path.join(self.model_dir, "classifier.pkl")
         vectorizer_path = os.path.join(self.model_dir, "vectorizer.pkl")
 
@@ -34,16 +86,100 @@ class MLFilter:
             self.vectorizer = None
             return False
 
+    def _load_onnx(self) -> bool:
+        """
+        Prefer model.onnx (see scripts/convert_ml_filter_to_onnx.py) served by
+        ONNX Runtime; falls back to the memory-mapped layout (if use_mmap),
+        then the joblib pickles, when unavailable.
+        """
+        onnx_path = os.path.join(self.model_dir, "model.onnx")
+        if not os.path.exists(onnx_path):
+            return False
+
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            logger.warning("model.onnx found but onnxruntime is not installed; using pickled model")
+            return False
+
+        try:
+            self.session = ort.InferenceSession(onnx_path, providers=["CPUExecutionProvider"])
+            self._onnx_input = self.session.get_inputs()[0].name
+            logger.info("ML classifier loaded from %s (ONNX Runtime)", onnx_path)
+            return True
+        except Exception as error:
+            logger.error("Failed to load ONNX model: %s", error)
+            self.session = None
+            self._onnx_input = None
+            return False
+
+    def _load_mmap(self) -> bool:
+        """
+        Load the memory-mapped layout (vectorizer without its vocabulary dict,
+        vocabulary as .npy arrays, classifier arrays via joblib mmap_mode).
+        """
+        skeleton_path = os.path.join(self.model_dir, _MMAP_SKELETON)
+        terms_path = os.path.join(self.model_dir, _MMAP_TERMS)
+        indices_path = os.path.join(self.model_dir, _MMAP_INDICES)
+        classifier_path = os.path.join(self.model_dir, "classifier.pkl")
+        if not all(os.path.exists(p) for p in (skeleton_path, terms_path, indices_path, classifier_path)):
+            return False
+
+        try:
+            vectorizer = joblib.load(skeleton_path, mmap_mode="r")
+            vectorizer.vocabulary_ = _MmapVocabulary(
+                np.load(terms_path, mmap_mode="r"),
+                np.load(indices_path, mmap_mode="r"),
+            )
+            self.vectorizer = vectorizer
+            self.classifier = joblib.load(classifier_path, mmap_mode="r")
+            logger.info("ML classifier loaded from %s (memory-mapped vocabulary)", self.model_dir)
+            return True
+        except Exception as error:
+            logger.error("Failed to load memory-mapped ML model: %s", error)
+            self.classifier = None
+            self.vectorizer = None
+            return False
+
+    def _is_loaded(self) -> bool:
+        return self.session is not None or (self.classifier is not None and self.vectorizer is not None)
+
+    def _predict(self, feature_texts: List[str]) -> List[bool]:
+        if self.session is not None:
+            inputs = np.array(feature_texts, dtype=object).reshape(-1, 1)
+            predictions = self.session.run(None, {self._onnx_input: inputs})[0]
+        else:
+            features = self.vectorizer.transform(feature_texts)
+            predictions = self.classifier.predict(features)
+        return [bool(int(prediction) == 1) for prediction in predictions]
+
     def predict_recruiter(self, subject: str, body: str, from_email: str) -> Optional[bool]:
         """Returns True/False if prediction succeeds, None on inference failure."""
-        if not self.classifier or not self.vectorizer:
+        if not self._is_loaded():
             return None
 
         try:
             feature_text = f"{subject or ''} {body or ''} {from_email or ''}"
-            features = self.vectorizer.transform([feature_text])
-            prediction = self.classifier.predict(features)[0]
-            return bool(int(prediction) == 1)
+            return self._predict([feature_text])[0]
         except Exception as error:
             logger.error("ML classification failed: %s", error)
             return None
+
+    def predict_recruiter_batch(
+        self, subjects: List[str], bodies: List[str], from_emails: List[str]
+    ) -> List[Optional[bool]]:
+        """Vectorize and predict many emails in one call. All None on inference failure."""
+        if not self._is_loaded():
+            return [None] * len(subjects)
+        if not subjects:
+            return []
+
+        try:
+            feature_texts = [
+                f"{subject or ''} {body or ''} {from_email or ''}"
+                for subject, body, from_email in zip(subjects, bodies, from_emails)
+            ]
+            return self._predict(feature_texts)
+        except Exception as error:
+            logger.error("ML batch classification failed: %s", error)
+            return [None] * len(subjects)
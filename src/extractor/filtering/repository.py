@@ -1,6 +1,7 @@
 import logging
 import re
 import csv
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 from ..connectors.http_api import get_api_client
@@ -14,6 +15,8 @@ class FilterRepository:
         self.logger = logging.getLogger(__name__)
         self._filters = None
         self._filters_by_priority = None
+        # Concurrent candidate runners may trigger the lazy load together
+        self._load_lock = threading.Lock()
         
     def load_filters(self) -> bool:
         """Load filters from CSV first, fallback to API if CSV not available"""
@@ -126,7 +129,9 @@ class FilterRepository:
     def get_filters(self) -> List[Dict]:
         """Get all cached filters"""
         if self._filters is None:
-            self.load_filters()
+            with self._load_lock:
+                if self._filters is None:
+                    self.load_filters()
         return self._filters or []
     
     def get_filters_by_category(self, category: str) -> List[Dict]:
@@ -195,6 +200,15 @@ class FilterRepository:
 
         return None  # No match
     
+    def check_emails_bulk(self, emails) -> Dict[str, Optional[str]]:
+        """
+        Check many emails at once; each distinct address is evaluated once.
+
+        Returns:
+            Dict mapping each email to 'allow', 'block' or None
+        """
+        return {email: self.check_email(email) for email in set(emails) if email}
+
     def _matches(self, text: str, pattern: str, match_type: str) -> bool:
         """Check if text matches pattern based on match_type"""
         try:
@@ -302,11 +316,15 @@ class FilterRepository:
 
 # Singleton instance
 _filter_repository = None
+_filter_repository_lock = threading.Lock()
 
 def get_filter_repository() -> FilterRepository:
     """Get global filter repository instance"""
     global _filter_repository
     if _filter_repository is None:
-        _filter_repository = FilterRepository()
-        _filter_repository.load_filters()
+        with _filter_repository_lock:
+            if _filter_repository is None:
+                repository = FilterRepository()
+                repository.load_filters()
+                _filter_repository = repository
     return _filter_repository
@@ -1,11 +1,37 @@
 import re
+import sys
+from collections import Counter
 from typing import Dict, List
 import logging
 from ..filtering.repository import get_filter_repository
 from ..filtering.ml_filter import MLFilter
 
+# Optional: single-pass multi-keyword scanning (pyahocorasick)
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
 logger = logging.getLogger(__name__)
 
+# This many distinct anti-recruiter keywords marks an email as non-recruiter
+ANTI_KEYWORD_LIMIT = 4
+
+
+def count_keywords(text: str, keywords, limit: int = None) -> int:
+    """Count keywords present in text, stopping as soon as `limit` is reached."""
+    count = 0
+    for kw in keywords:
+        if kw in text:
+            count += 1
+            if count == limit:
+                break
+    return count
+
+# Address inside <...>, (...) or as the whole From header
+_EMAIL_RE = re.compile(r'(?:<|\(|^)([\w\.-]+@[\w\.-]+)(?:>|\)|$)', re.IGNORECASE)
+
 class EmailFilter:
     """Filter and classify emails (recruiter vs junk)"""
     
@@ -19,20 +45,31 @@ class EmailFilter:
         # Get keyword lists from database
         keyword_lists = self.filter_repo.get_keyword_lists()
         
-        # Extract recruiter and anti-recruiter keywords
-        self.recruiter_keywords = keyword_lists.get('recruiter_keywords', [])
-        self.anti_recruiter_keywords = keyword_lists.get('anti_recruiter_keywords', [])
+        # Extract recruiter and anti-recruiter keywords, lowercased once here
+        # (they are matched against lowercased text) and frozen as tuples
+        self.recruiter_keywords = self._normalize_keywords(keyword_lists.get('recruiter_keywords', []))
+        self.anti_recruiter_keywords = self._normalize_keywords(keyword_lists.get('anti_recruiter_keywords', []))
+        
+        # Aho-Corasick automatons: one O(len(text)) pass instead of one scan per keyword
+        self._ac_recruit = self._build_automaton(self.recruiter_keywords)
+        self._ac_anti = self._build_automaton(self.anti_recruiter_keywords)
         
         # Load ML classifier if enabled
         self.use_ml = config.get('filters', {}).get('use_ml_classifier', False)
         self.ml_filter = None
         if self.use_ml:
             self._load_ml_model()
+
+        # Classification strategy is fixed once the model is (or isn't) loaded
+        self._classify_recruiters = (
+            self._classify_recruiters_ml if self.ml_filter else self._classify_recruiters_rules
+        )
     
     def _load_ml_model(self):
         """Load pre-trained ML classifier"""
-        model_dir = self.config.get('filters', {}).get('ml_model_dir', '../models')
-        ml_filter = MLFilter(model_dir=model_dir)
+        filters_config = self.config.get('filters', {})
+        model_dir = filters_config.get('ml_model_dir', '../models')
+        ml_filter = MLFilter(model_dir=model_dir, use_mmap=filters_config.get('ml_mmap_vocabulary', False))
         if ml_filter.load():
             self.ml_filter = ml_filter
             self.logger.info("ML filtering enabled")
@@ -42,10 +79,63 @@ class EmailFilter:
         self.ml_filter = None
         self.use_ml = False
 
-    def _classify_with_ml(self, subject: str, body: str, from_email: str):
-        if not self.ml_filter:
+    def _classify_recruiters_ml(self, subjects: List[str], bodies: List[str], from_emails: List[str]) -> List[bool]:
+        """One batched ML prediction; rules only for emails the model could not score."""
+        ml_results = self.ml_filter.predict_recruiter_batch(subjects, bodies, from_emails)
+        return [
+            ml_result if ml_result is not None else self._classify_with_rules(subject, body)
+            for subject, body, ml_result in zip(subjects, bodies, ml_results)
+        ]
+
+    def _classify_recruiters_rules(self, subjects: List[str], bodies: List[str], from_emails: List[str]) -> List[bool]:
+        return [self._classify_with_rules(subject, body) for subject, body in zip(subjects, bodies)]
+
+    @staticmethod
+    def _normalize_keywords(keywords: List[str]) -> tuple:
+        return tuple(sys.intern(kw.lower()) for kw in keywords if kw)
+
+    @staticmethod
+    def _build_automaton(keywords: tuple):
+        """
+        Build an Aho-Corasick automaton whose values are how often each keyword
+        appears in the list, so tallies match the per-keyword substring loop.
+        Returns None when pyahocorasick is unavailable or there are no keywords.
+        """
+        if not _HAS_AHOCORASICK or not keywords:
             return None
-        return self.ml_filter.predict_recruiter(subject=subject, body=body, from_email=from_email)
+        automaton = ahocorasick.Automaton()
+        for kw, count in Counter(keywords).items():
+            if kw:
+                automaton.add_word(kw, (kw, count))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def _count_distinct_matches(automaton, text: str, limit: int = None) -> int:
+        """
+        Number of keywords (with list multiplicity) occurring anywhere in text,
+        stopping as soon as `limit` is reached.
+        """
+        seen = {}
+        total = 0
+        for _, (kw, count) in automaton.iter(text):
+            if kw not in seen:
+                seen[kw] = count
+                total += count
+                if limit is not None and total >= limit:
+                    break
+        return total
+
+    def _has_recruiter_match(self, subject_lower: str, text: str) -> bool:
+        """
+        Scan "subject body" and stop at the first recruiter keyword lying fully
+        inside the subject or fully inside the body.
+        """
+        subject_len = len(subject_lower)
+        for end_index, (kw, _) in self._ac_recruit.iter(text):
+            if end_index < subject_len or end_index - len(kw) >= subject_len:
+                return True
+        return False
 
     def _classify_with_rules(self, subject: str, body: str) -> bool:
         """Rule-only recruiter classifier."""
@@ -53,31 +143,25 @@ class EmailFilter:
         body_lower = (body or "").lower()
         text = f"{subject_lower} {body_lower}"
 
-        anti_keyword_count = sum(1 for kw in self.anti_recruiter_keywords if kw in text)
-        if anti_keyword_count >= 4:
+        if self._ac_anti is not None:
+            anti_keyword_count = self._count_distinct_matches(self._ac_anti, text, ANTI_KEYWORD_LIMIT)
+        else:
+            anti_keyword_count = count_keywords(text, self.anti_recruiter_keywords, ANTI_KEYWORD_LIMIT)
+        if anti_keyword_count >= ANTI_KEYWORD_LIMIT:
             return False
 
-        subject_keyword_count = sum(1 for kw in self.recruiter_keywords if kw in subject_lower)
-        body_keyword_count = sum(1 for kw in self.recruiter_keywords if kw in body_lower)
-
-        if subject_keyword_count >= 1:
-            return True
-        if body_keyword_count >= 2:
-            return True
-        if subject_keyword_count + body_keyword_count >= 1:
-            return True
-        return False
+        # subject >= 1, body >= 2 or subject + body >= 1 keywords: together that is
+        # "any recruiter keyword in subject or body", so stop at the first hit.
+        if self._ac_recruit is not None:
+            return self._has_recruiter_match(subject_lower, text)
+        return any(kw in subject_lower or kw in body_lower for kw in self.recruiter_keywords)
     
     def _extract_clean_email(self, from_header: str) -> str:
         """Extract email address from From header"""
         if not from_header:
             return ""
         
-        email_match = re.search(
-            r'(?:<|\(|^)([\w\.-]+@[\w\.-]+)(?:>|\)|$)',
-            from_header,
-            re.IGNORECASE
-        )
+        email_match = _EMAIL_RE.search(from_header)
         return email_match.group(1).lower() if email_match else ""
     
     def is_junk_email(self, from_header: str) -> bool:
@@ -91,10 +175,10 @@ class EmailFilter:
         action = self.filter_repo.check_email(email)
         
         if action == 'block':
-            self.logger.debug(f"Blocked by filter: {email}")
+            self.logger.debug("Blocked by filter: %s", email)
             return True
         elif action == 'allow':
-            self.logger.debug(f"Allowed by filter: {email}")
+            self.logger.debug("Allowed by filter: %s", email)
             return False
         
         # No match - default to not junk
@@ -106,13 +190,7 @@ class EmailFilter:
         if self.is_junk_email(from_email):
             return False
         
-        # If ML classifier available, use it
-        if self.use_ml:
-            ml_result = self._classify_with_ml(subject, body, from_email)
-            if ml_result is not None:
-                return ml_result
-
-        return self._classify_with_rules(subject, body)
+        return self._classify_recruiters([subject], [body], [from_email])[0]
     
     def is_calendar_invite(self, email_message) -> bool:
         """Check if email is a calendar invite"""
@@ -137,23 +215,26 @@ class EmailFilter:
             - filtered_emails: List of emails that passed filtering
             - filter_stats: Dict with filtering statistics
         """
-        filtered = []
+        keep = [False] * len(emails)
         junk_count = 0
         not_recruiter_count = 0
         calendar_count = 0
-        
-        for email_data in emails:
+        process_calendar = self.config.get('processing', {}).get('calendar_invites', {}).get('process', True)
+
+        # Pass 1: calendar/junk screening and body extraction
+        pending = []  # (index, email_data, subject, body, from_header)
+        for index, email_data in enumerate(emails):
             try:
                 msg = email_data['message']
                 from_header = msg.get('From', '')
                 subject = msg.get('Subject', '')
                 
                 # Always include calendar invites
-                if self.config.get('processing', {}).get('calendar_invites', {}).get('process', True):
+                if process_calendar:
                     if self.is_calendar_invite(msg):
-                        self.logger.debug(f"Including calendar invite from {from_header}")
+                        self.logger.debug("Including calendar invite from %s", from_header)
                         calendar_count += 1
-                        filtered.append(email_data)
+                        keep[index] = True
                         continue
                 
                 # Skip junk emails
@@ -163,17 +244,32 @@ class EmailFilter:
                 
                 # Extract and clean body
                 body = cleaner.extract_body(msg)
-                
-                # Check if recruiter email
-                if self.is_recruiter_email(subject, body, from_header):
-                    email_data['clean_body'] = body
-                    filtered.append(email_data)
-                else:
-                    not_recruiter_count += 1
+                pending.append((index, email_data, subject, body, from_header))
                     
             except Exception as e:
                 self.logger.error(f"Error filtering email: {str(e)}")
                 continue
+
+        # Pass 2: recruiter classification, made in one call to the strategy chosen at init
+        if pending:
+            try:
+                decisions = self._classify_recruiters(
+                    [item[2] for item in pending],
+                    [item[3] for item in pending],
+                    [item[4] for item in pending]
+                )
+            except Exception as e:
+                self.logger.error(f"Error filtering emails: {str(e)}")
+                decisions = []
+
+            for (index, email_data, subject, body, from_header), is_recruiter in zip(pending, decisions):
+                if is_recruiter:
+                    email_data['clean_body'] = body
+                    keep[index] = True
+                else:
+                    not_recruiter_count += 1
+
+        filtered = [email_data for email_data, kept in zip(emails, keep) if kept]
         
         # Build filter statistics
         filter_stats = {
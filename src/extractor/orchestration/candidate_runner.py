@@ -1,4 +1,5 @@
 import logging
+import threading
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
@@ -63,6 +64,7 @@ class CandidateRunner:
         connector_cls=GmailIMAPConnector,
         reader_cls=EmailReader,
         deduplication_cache=None,
+        fetch_batch_size: int = 100,
     ):
         self.config = config
         self.cleaner = cleaner
@@ -73,7 +75,11 @@ class CandidateRunner:
         self.connector_cls = connector_cls
         self.reader_cls = reader_cls
         self.deduplication_cache = deduplication_cache
+        self.fetch_batch_size = fetch_batch_size
         self.logger = logging.getLogger(__name__)
+        # The filter (ML/LLM) and extractor (spaCy/GLiNER) instances are shared
+        # by every runner thread and are not thread-safe; IMAP I/O still overlaps.
+        self._model_lock = threading.Lock()
 
     def run(self, candidate: Dict) -> CandidateRunResult:
         email = (candidate.get("email") or "").strip()
@@ -132,7 +138,7 @@ class CandidateRunner:
         last_processed_uid = None  # Track the highest UID seen in this run
 
         try:
-            reader = self.reader_cls(connector)
+            reader = self.reader_cls(connector, fetch_batch_size=self.fetch_batch_size)
             batch_size = int(self.config.get("email", {}).get("batch_size", 100))
 
             # ── UID Resumption ────────────────────────────────────────────────
@@ -159,7 +165,8 @@ class CandidateRunner:
                     break
 
                 emails_fetched += len(emails)
-                filtered_emails, batch_stats = self.email_filter.filter_emails(emails, self.cleaner)
+                with self._model_lock:
+                    filtered_emails, batch_stats = self.email_filter.filter_emails(emails, self.cleaner)
                 for key in filter_stats:
                     filter_stats[key] += int(batch_stats.get(key, 0))
 
@@ -167,12 +174,13 @@ class CandidateRunner:
                     try:
                         message = email_data["message"]
                         clean_body = email_data.get("clean_body") or self.cleaner.extract_body(message)
-                        contacts = self.extractor.extract_contacts(
-                            message,
-                            clean_body,
-                            source_email=email,
-                            subject=message.get("Subject", ""),
-                        )
+                        with self._model_lock:
+                            contacts = self.extractor.extract_contacts(
+                                message,
+                                clean_body,
+                                source_email=email,
+                                subject=message.get("Subject", ""),
+                            )
                         for contact in contacts:
                             if not (contact.get("email") or contact.get("linkedin_id")):
                                 continue
@@ -180,7 +188,7 @@ class CandidateRunner:
                             # Deduplicate against DB cache (contacts already in DB)
                             contact_email = (contact.get("email") or "").strip().lower()
                             if contact_email and contact_email in seen_emails:
-                                self.logger.debug(f"Skipping duplicate contact found in DB: {contact_email}")
+                                self.logger.debug("Skipping duplicate contact found in DB: %s", contact_email)
                                 deduplicated_count += 1
                                 continue
 
@@ -192,17 +200,15 @@ class CandidateRunner:
                             contact["extracted_from_uid"] = email_data.get("uid")
                             contact["candidate_id"] = candidate_id  # tag for bulk save
 
-                            # Intra-run global deduplication cache (across candidates)
-                            if self.deduplication_cache and self.deduplication_cache.is_seen_in_run(contact_email):
+                            # Intra-run global deduplication cache (across candidates).
+                            # claim_in_run is atomic so concurrent runners cannot both keep a contact.
+                            if self.deduplication_cache and not self.deduplication_cache.claim_in_run(contact_email):
                                 deduplicated_count += 1
-                                self.logger.info(f"Skipping intra-run duplicate: {contact_email}")
+                                self.logger.info("Skipping intra-run duplicate: %s", contact_email)
                                 continue
 
                             extracted_contacts.append(contact)
 
-                            if self.deduplication_cache:
-                                self.deduplication_cache.mark_seen_in_run(contact_email)
-
                     except Exception as extraction_error:
                         self.logger.error(
                             "Error extracting candidate_id=%s email=%s uid=%s: %s",
@@ -229,16 +235,22 @@ class CandidateRunner:
                 start_index = next_start_index
 
             # ── Summary log ──────────────────────────────────────────────────
-            self.logger.info("=" * 60)
-            self.logger.info(f"PROCESSING SUMMARY for {email}:")
-            self.logger.info(f"  - Emails Fetched:       {emails_fetched}")
-            self.logger.info(f"  - Last UID (resumed):   {last_uid or 'None (first run)'}")
-            self.logger.info(f"  - Last UID (updated):   {last_processed_uid or 'No new emails'}")
-            self.logger.info(f"  - Existing Contacts:    {len(seen_emails)} (Cached from DB)")
-            self.logger.info(f"  - New Deduplicates:     {deduplicated_count} (Skipped locally)")
-            self.logger.info(f"  - Unique to Save:       {len(extracted_contacts)}")
-            # self.logger.info(f"  - Positions Saved:      {self.positions_saved}") # Silenced
-            self.logger.info("=" * 60)
+            # Formatted only when INFO is enabled, and emitted as one record so
+            # summaries from concurrent candidate threads don't interleave.
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "\n".join((
+                        "=" * 60,
+                        f"PROCESSING SUMMARY for {email}:",
+                        f"  - Emails Fetched:       {emails_fetched}",
+                        f"  - Last UID (resumed):   {last_uid or 'None (first run)'}",
+                        f"  - Last UID (updated):   {last_processed_uid or 'No new emails'}",
+                        f"  - Existing Contacts:    {len(seen_emails)} (Cached from DB)",
+                        f"  - New Deduplicates:     {deduplicated_count} (Skipped locally)",
+                        f"  - Unique to Save:       {len(extracted_contacts)}",
+                        "=" * 60,
+                    ))
+                )
 
             non_vendor_count = filter_stats.get("junk", 0) + filter_stats.get("not_recruiter", 0)
 
@@ -1,9 +1,18 @@
-import json
+import atexit
+import gzip
 import logging
 import os
-from datetime import datetime
+import shutil
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 from ..connectors.http_api import get_api_client
 from ..connectors.imap_gmail import GmailIMAPConnector
@@ -16,7 +25,7 @@ from ..orchestration.candidate_runner import CandidateRunner
 from ..persistence.db_candidate_source import DatabaseCandidateSource
 from ..persistence.job_activity import JobActivityLogUtil
 from ..persistence.vendor_contacts import VendorUtil
-from ..reporting.email_reporter import EmailReporter
+from ..reporting.email_reporter import EmailReporter, NullEmailReporter
 from ..state.uid_tracker import get_uid_tracker
 from ..state.cache import DeduplicationCache
 from ..workflow.manager import WorkflowManager
@@ -26,6 +35,50 @@ logger = logging.getLogger(__name__)
 # Project root = 3 levels above this file (src/extractor/orchestration/service.py)
 _PROJECT_ROOT = Path(__file__).resolve().parents[3]
 
+# Buffered contacts that trigger a VendorUtil flush (save_chunk_size runtime parameter)
+_SAVE_CHUNK_SIZE = 1000
+
+# Cap on contacts embedded in the JSON report
+_REPORT_CONTACT_LIMIT = 500
+
+# SMTP delivery runs on a single background worker shared by every service
+# instance, so run() returns without waiting on the mail server; flushed
+# before process exit.
+_REPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report")
+atexit.register(_REPORT_EXECUTOR.shutdown, wait=True)
+
+
+def _log_report_failure(future) -> None:
+    error = future.exception()
+    if error is not None:
+        logger.error("Report email delivery failed: %s", error, exc_info=error)
+
+
+# Datetimes go through default=str, as with json.dump, instead of orjson's isoformat
+_JSON_COMPACT_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+_JSON_OPTIONS = _JSON_COMPACT_OPTIONS | orjson.OPT_INDENT_2
+
+
+@lru_cache(maxsize=32)
+def _ensure_dir(path: str) -> Path:
+    """Create an output directory once per process; later calls skip the mkdir/stat."""
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def _dump_json(data: Dict, compress: bool = False) -> Tuple[bytes, str]:
+    """
+    Serialize run logs/reports; unknown types and datetimes fall back to str()
+    like json.dump(default=str). Non-ASCII text is written as UTF-8, not escaped.
+    Returns (payload, file suffix). Compressed output is gzip level 1 without
+    indentation, since nobody reads it unpacked.
+    """
+    if compress:
+        payload = orjson.dumps(data, default=str, option=_JSON_COMPACT_OPTIONS)
+        return gzip.compress(payload, compresslevel=1), ".json.gz"
+    return orjson.dumps(data, default=str, option=_JSON_OPTIONS), ".json"
+
 
 class EmailExtractionService:
     """Main service for candidate email extraction workflow."""
@@ -49,14 +102,16 @@ class EmailExtractionService:
 
         self.api_client = None
         self.vendor_util = None
-        self.job_activity_log_util = None
         self.cleaner = None
         self.extractor = None
         self.email_filter = None
         self.uid_tracker = None
         self.deduplication_cache = None
         self.candidate_runner = None
-        self.email_reporter = None
+
+        # Monotonic start of the current run; wall-clock jumps don't skew duration
+        self._run_started_monotonic: Optional[float] = None
+        self._report_executor = _REPORT_EXECUTOR
 
         self._initialize_components()
 
@@ -74,7 +129,6 @@ class EmailExtractionService:
         try:
             self.api_client = get_api_client()
             self.vendor_util = VendorUtil(self.api_client)
-            self.job_activity_log_util = JobActivityLogUtil(self.api_client)
             self.logger.info("API-backed persistence initialized")
         except Exception as error:
             self.logger.warning("API client unavailable, persistence disabled: %s", error)
@@ -109,10 +163,29 @@ class EmailExtractionService:
             vendor_util=self.vendor_util,
             connector_cls=GmailIMAPConnector,
             reader_cls=EmailReader,
+            fetch_batch_size=int(self.runtime_parameters.get("fetch_batch_size", 100)),
         )
 
-        # Initialize SMTP email reporter from environment variables
-        smtp_config = {
+        self.logger.info("Service components initialized")
+
+    @cached_property
+    def job_activity_log_util(self) -> Optional[JobActivityLogUtil]:
+        """Built on first use; None when the API client is unavailable."""
+        if self.api_client is None:
+            return None
+        return JobActivityLogUtil(self.api_client)
+
+    @cached_property
+    def email_reporter(self):
+        """Built on first use from SMTP environment variables; no-op when incomplete."""
+        smtp_config = self._read_smtp_config()
+        if not all(smtp_config[key] for key in EmailReporter.REQUIRED_KEYS):
+            return NullEmailReporter()
+        return EmailReporter(smtp_config)
+
+    @staticmethod
+    def _read_smtp_config() -> Dict:
+        return {
             "SMTP_SERVER": os.getenv("SMTP_SERVER"),
             "SMTP_PORT": os.getenv("SMTP_PORT", "587"),
             "SMTP_USERNAME": os.getenv("SMTP_USERNAME"),
@@ -120,8 +193,6 @@ class EmailExtractionService:
             "REPORT_FROM_EMAIL": os.getenv("REPORT_FROM_EMAIL"),
             "REPORT_TO_EMAIL": os.getenv("REPORT_TO_EMAIL"),
         }
-        self.email_reporter = EmailReporter(smtp_config)
-        self.logger.info("Service components initialized")
 
     def run(
         self,
@@ -133,8 +204,9 @@ class EmailExtractionService:
             "run_id": self.run_id,
             "parameters": self.runtime_parameters,
             "candidates": [],
-            "started_at": datetime.utcnow().isoformat(),
+            "started_at": datetime.now(timezone.utc).isoformat(),
         }
+        self._run_started_monotonic = time.monotonic()
 
         total_contacts = 0
         total_positions = 0
@@ -143,13 +215,16 @@ class EmailExtractionService:
         total_emails_fetched = 0
         total_duplicates = 0
         total_non_vendor = 0
+        total_finalized = 0
+        total_ner_fallback = 0
 
         try:
             # ── Global dedup cache warm-up ─────────────────────────────────────
             if self.vendor_util and self.deduplication_cache:
                 self.logger.info("Initializing global deduplication cache...")
-                recent_emails = self.vendor_util.get_recent_vendor_emails(limit=5000)
-                self.deduplication_cache.add_known_db_emails(recent_emails)
+                self.deduplication_cache.add_known_db_emails(
+                    self.vendor_util.get_recent_vendor_emails(limit=5000)
+                )
 
             candidates = self.candidate_source.get_active_candidates(
                 candidate_id=candidate_id,
@@ -172,74 +247,91 @@ class EmailExtractionService:
                 return summary
 
             # ── Phase 1: Extract from ALL candidates ───────────────────────────
-            # Nothing is saved to DB here. Each runner returns its contacts.
-            all_extracted_contacts: List[Dict] = []
+            # Each runner returns its contacts; they go to VendorUtil's write
+            # buffer as results arrive, so saving overlaps the remaining runs.
+            total_extracted_contacts = 0
+            save_seen_keys: set = set()
+            save_result: Dict[str, int] = {"contacts_inserted": 0, "contacts_skipped": 0,
+                                           "positions_inserted": 0, "positions_skipped": 0}
             candidate_results = []
 
             # Guard: skip any candidate whose email has already been processed
             # in this run (handles duplicate DB rows for the same inbox).
-            seen_candidate_emails: set = set()
-
-            for candidate in candidates:
-                cand_email = (candidate.get("email") or "").strip().lower()
-                if cand_email and cand_email in seen_candidate_emails:
-                    self.logger.warning(
-                        "Skipping duplicate candidate email in run: %s — already processed this inbox",
-                        cand_email,
-                    )
-                    total_failed += 1
-                    continue
+            # Resolved in one pre-pass before any work is submitted: the first
+            # row per normalized inbox runs, every extra row counts as failed.
+            normalized = [((c.get("email") or "").strip().lower(), c) for c in candidates]
+            first_by_email: Dict[str, Dict] = {}
+            for cand_email, candidate in normalized:
                 if cand_email:
-                    seen_candidate_emails.add(cand_email)
-
-                result = self.candidate_runner.run(candidate)
-                candidate_results.append(result)
-                execution_metadata["candidates"].append(result.to_metadata())
-                total_emails_fetched += result.emails_fetched
-                total_duplicates += result.duplicates_skipped
-                total_non_vendor += result.non_vendor_filtered
-
-                if result.status != "success":
-                    total_failed += 1
-                    self.logger.error(
-                        "Candidate %s (%s) FAILED: %s",
-                        result.candidate_id,
-                        result.email,
-                        result.error,
-                    )
-                else:
-                    all_extracted_contacts.extend(result.extracted_contacts)
-
-            # ── Phase 2: Single bulk save for ALL candidates ───────────────────
-            self.logger.info("=" * 70)
-            self.logger.info("BULK SAVE: %d contacts from all candidates", len(all_extracted_contacts))
-            self.logger.info("=" * 70)
-
-            save_result = {"contacts_inserted": 0, "contacts_skipped": 0,
-                           "positions_inserted": 0, "positions_skipped": 0}
-
-            if all_extracted_contacts and self.vendor_util:
-                try:
-                    save_result = self.vendor_util.save_contacts(all_extracted_contacts)
-                    total_contacts = save_result.get("contacts_inserted", 0)
-                    total_positions = save_result.get("positions_inserted", 0)
-                    total_extracts = save_result.get("extracts_inserted", 0)
-                    total_finalized = save_result.get("positions_finalized", 0)
-                    total_ner_fallback = save_result.get("ner_fallback_inserted", 0)
-                    
-                    self.logger.info(
-                        "Bulk save complete: %d contacts, %d audit extracts, %d finalized, %d fallbacks",
-                        total_contacts,
-                        total_extracts,
-                        total_finalized,
-                        total_ner_fallback,
-                    )
-                except Exception as save_error:
-                    self.logger.error("Bulk save failed: %s", save_error, exc_info=True)
-            elif not self.vendor_util:
-                self.logger.warning("vendor_util not available — skipping DB/API save")
-            else:
-                self.logger.info("No contacts extracted — nothing to save")
+                    first_by_email.setdefault(cand_email, candidate)
+            runnable_candidates = [
+                candidate for cand_email, candidate in normalized
+                if not cand_email or first_by_email[cand_email] is candidate
+            ]
+
+            duplicate_rows = len(candidates) - len(runnable_candidates)
+            if duplicate_rows:
+                duplicated = Counter(e for e, _ in normalized if e)
+                self.logger.warning(
+                    "Skipping %d duplicate candidate rows in run (already processing these inboxes): %s",
+                    duplicate_rows,
+                    ", ".join(e for e, count in duplicated.items() if count > 1),
+                )
+                total_failed += duplicate_rows
+
+            # Each runner is IMAP/HTTP-bound, so inboxes can be processed on a
+            # bounded thread pool (opt-in via candidate_concurrency). Results
+            # are aggregated on this thread only, in submission order, so the
+            # run log and report stay deterministic.
+            max_workers = max(1, int(self.runtime_parameters.get("candidate_concurrency", 1)))
+            self.logger.info(
+                "Processing %d candidates with %d workers", len(runnable_candidates), max_workers
+            )
+
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="candidate") as executor:
+                futures = [
+                    executor.submit(self.candidate_runner.run, candidate)
+                    for candidate in runnable_candidates
+                ]
+                for future in futures:
+                    result = future.result()
+                    candidate_results.append(result)
+                    execution_metadata["candidates"].append(result.to_metadata())
+                    total_emails_fetched += result.emails_fetched
+                    total_duplicates += result.duplicates_skipped
+                    total_non_vendor += result.non_vendor_filtered
+
+                    if result.status != "success":
+                        total_failed += 1
+                        self.logger.error(
+                            "Candidate %s (%s) FAILED: %s",
+                            result.candidate_id,
+                            result.email,
+                            result.error,
+                        )
+                    else:
+                        total_extracted_contacts += len(result.extracted_contacts)
+                        self._submit_contacts(result.extracted_contacts, save_seen_keys, save_result)
+
+            # ── Phase 2 + 3 + UID flush, pipelined ─────────────────────────────
+            # Phase 2 flushes whatever is still buffered. The activity log and
+            # the final UID flush do not depend on the save result, so all
+            # three run concurrently on a small pool.
+            with ThreadPoolExecutor(max_workers=3, thread_name_prefix="persist") as io_pool:
+                save_future = io_pool.submit(
+                    self._save_all_contacts, total_extracted_contacts, save_seen_keys, save_result
+                )
+                log_future = io_pool.submit(self._log_activities, candidate_results)
+                uid_future = io_pool.submit(self._flush_uids, candidate_results)
+
+                save_result = save_future.result()
+                total_contacts = save_result.get("contacts_inserted", 0)
+                total_positions = save_result.get("positions_inserted", 0)
+                total_extracts = save_result.get("extracts_inserted", 0)
+                total_finalized = save_result.get("positions_finalized", 0)
+                total_ner_fallback = save_result.get("ner_fallback_inserted", 0)
+                log_future.result()
+                uid_future.result()
 
             # Update candidate-level contacts_saved / positions_saved in metadata
             # (We distribute the totals to the summary; per-candidate is already 0)
@@ -247,26 +339,6 @@ class EmailExtractionService:
                 meta["bulk_contacts_inserted"] = total_contacts
                 meta["bulk_positions_inserted"] = total_positions
 
-            # ── Phase 3: Log activity per candidate ──────────────────────────
-            if self.job_activity_log_util:
-                activity_logs = []
-                for result in candidate_results:
-                    log_item = self._prepare_activity_log_item(
-                        candidate_id=result.candidate_id,
-                        email=result.email,
-                        contacts_saved=result.contacts_saved,
-                        positions_saved=result.positions_saved,
-                        emails_fetched=result.emails_fetched,
-                        filter_stats=result.filter_stats,
-                        error_message=result.error,
-                    )
-                    if log_item:
-                        activity_logs.append(log_item)
-                
-                if activity_logs:
-                    self.logger.info("Sending %d job activity logs in bulk", len(activity_logs))
-                    self.job_activity_log_util.log_activities_bulk(activity_logs)
-
             overall_status = "success"
             if total_failed > 0:
                 overall_status = "partial_success"
@@ -296,6 +368,8 @@ class EmailExtractionService:
                 total_found=total_found,
                 total_finalized=total_finalized,
                 total_ner_fallback=total_ner_fallback,
+                total_duplicates=total_duplicates,
+                total_non_vendor=total_non_vendor,
             )
             self._update_run_status(
                 status=overall_status,
@@ -307,25 +381,10 @@ class EmailExtractionService:
             )
             self._persist_execution_log(summary)
 
-            # ── Final UID flush — authoritative post-run persistence ──────────
-            # mid-run update_last_uid() only fires when a batch advances the
-            # high-water mark. Here we do a final sweep so every successful
-            # candidate has its latest UID and last_run timestamp written to
-            # last_run.json, even if no new emails were found this cycle.
-            flushed = 0
-            for result in candidate_results:
-                if result.status == "success" and result.last_uid and result.email:
-                    self.uid_tracker.update_last_uid(result.email, result.last_uid, force_timestamp=True)
-                    flushed += 1
-            if flushed:
-                self.logger.info(
-                    "Final UID flush: persisted last_uid for %d candidates to last_run.json", flushed
-                )
-
             # ── Report: JSON save + SMTP email ────────────────────────────────
             report = self._generate_json_report(summary)
             self._save_json_report(report)
-            self.email_reporter.send_report(report)
+            self._send_report_async(report)
 
             return summary
 
@@ -343,6 +402,8 @@ class EmailExtractionService:
                 total_found=total_found,
                 total_finalized=0,
                 total_ner_fallback=0,
+                total_duplicates=total_duplicates,
+                total_non_vendor=total_non_vendor,
             )
             self._update_run_status(
                 status="failed",
@@ -355,9 +416,113 @@ class EmailExtractionService:
             self._persist_execution_log(summary)
             report = self._generate_json_report(summary)
             self._save_json_report(report)
-            self.email_reporter.send_report(report)
+            self._send_report_async(report)
             raise
 
+    def _send_report_async(self, report: Dict) -> None:
+        """Queue the report email on the shared SMTP worker; failures are logged."""
+        future = self._report_executor.submit(self.email_reporter.send_report, report)
+        future.add_done_callback(_log_report_failure)
+
+    def _submit_contacts(self, contacts: List[Dict], seen_keys: set, save_result: Dict) -> None:
+        """Hand one candidate's contacts to the write buffer; merges any flush counts."""
+        if not contacts or not self.vendor_util:
+            return
+        flush_size = max(1, int(self.runtime_parameters.get("save_chunk_size", _SAVE_CHUNK_SIZE)))
+        try:
+            partial = self.vendor_util.submit_contacts(
+                contacts, seen_keys=seen_keys, flush_size=flush_size
+            )
+        except Exception as save_error:
+            self.logger.error("Buffered contact save failed: %s", save_error, exc_info=True)
+            return
+        for key, value in partial.items():
+            save_result[key] = save_result.get(key, 0) + value
+
+    def _save_all_contacts(self, total_contacts: int, seen_keys: set, save_result: Dict) -> Dict:
+        """
+        Phase 2: flush the contacts still buffered after Phase 1. Earlier
+        flushes already added their counts to save_result; the shared
+        seen_keys set keeps dedup across every flush of the run.
+        """
+        self.logger.info("=" * 70)
+        self.logger.info("BULK SAVE: %d contacts from all candidates", total_contacts)
+        self.logger.info("=" * 70)
+
+        if total_contacts and self.vendor_util:
+            try:
+                partial = self.vendor_util.flush_contacts(seen_keys=seen_keys)
+            except Exception as save_error:
+                self.logger.error("Final contact flush failed: %s", save_error, exc_info=True)
+                partial = {}
+            for key, value in partial.items():
+                save_result[key] = save_result.get(key, 0) + value
+            self.logger.info(
+                "Bulk save complete: %d contacts, %d audit extracts, %d finalized, %d fallbacks",
+                save_result.get("contacts_inserted", 0),
+                save_result.get("extracts_inserted", 0),
+                save_result.get("positions_finalized", 0),
+                save_result.get("ner_fallback_inserted", 0),
+            )
+        elif not self.vendor_util:
+            self.logger.warning("vendor_util not available — skipping DB/API save")
+        else:
+            self.logger.info("No contacts extracted — nothing to save")
+        return save_result
+
+    def _log_activities(self, candidate_results: List) -> None:
+        """Phase 3: log activity per candidate."""
+        if not candidate_results or not self.job_activity_log_util:
+            return
+        activity_logs = [
+            log_item
+            for result in candidate_results
+            if (log_item := self._prepare_activity_log_item(
+                candidate_id=result.candidate_id,
+                email=result.email,
+                contacts_saved=result.contacts_saved,
+                positions_saved=result.positions_saved,
+                emails_fetched=result.emails_fetched,
+                filter_stats=result.filter_stats,
+                error_message=result.error,
+            )) is not None
+        ]
+
+        if activity_logs:
+            self.logger.info("Sending %d job activity logs in bulk", len(activity_logs))
+            try:
+                self.job_activity_log_util.log_activities_bulk(activity_logs)
+            except Exception as log_error:
+                self.logger.error("Bulk activity logging failed: %s", log_error, exc_info=True)
+
+    def _flush_uids(self, candidate_results: List) -> int:
+        """
+        Final UID flush — authoritative post-run persistence.
+
+        mid-run update_last_uid() only fires when a batch advances the
+        high-water mark. Here we do a final sweep so every successful
+        candidate has its latest UID and last_run timestamp written to
+        last_run.json, even if no new emails were found this cycle.
+        """
+        updates = {
+            result.email: (result.last_uid, True)
+            for result in candidate_results
+            if result.status == "success" and result.last_uid and result.email
+        }
+        flushed = 0
+        try:
+            if updates:
+                # One write of last_run.json for the whole run
+                self.uid_tracker.update_last_uids_bulk(updates)
+                flushed = len(updates)
+        except Exception as flush_error:
+            self.logger.error("Final UID flush failed: %s", flush_error, exc_info=True)
+        if flushed:
+            self.logger.info(
+                "Final UID flush: persisted last_uid for %d candidates to last_run.json", flushed
+            )
+        return flushed
+
     def _update_run_status(
         self,
         status: str,
@@ -390,14 +555,17 @@ class EmailExtractionService:
         total_found: int = 0,
         total_finalized: int = 0,
         total_ner_fallback: int = 0,
+        total_duplicates: int = 0,
+        total_non_vendor: int = 0,
     ) -> Dict:
         candidates = execution_metadata.get("candidates", [])
-        success_candidates = [
-            item.get("candidate_email") for item in candidates if item.get("status") == "success"
-        ]
-        failed_candidates = [
-            item.get("candidate_email") for item in candidates if item.get("status") != "success"
-        ]
+        success_candidates = []
+        failed_candidates = []
+        for item in candidates:
+            if item.get("status") == "success":
+                success_candidates.append(item.get("candidate_email"))
+            else:
+                failed_candidates.append(item.get("candidate_email"))
         execution_metadata["summary"] = {
             "total_candidates": len(candidates),
             "success_count": len(success_candidates),
@@ -406,6 +574,8 @@ class EmailExtractionService:
             "total_positions_inserted": total_positions,
             "total_extracts_inserted": total_extracts,
             "total_emails_fetched": total_emails_fetched,
+            "total_duplicates": total_duplicates,
+            "total_non_vendor": total_non_vendor,
             "total_found_valid": total_found,
             "total_candidates_failed": total_failed,
             "total_finalized": total_finalized,
@@ -413,18 +583,24 @@ class EmailExtractionService:
             "successful_candidates": success_candidates,
             "failed_candidates": failed_candidates,
         }
-        execution_metadata["finished_at"] = datetime.utcnow().isoformat()
+        execution_metadata["finished_at"] = datetime.now(timezone.utc).isoformat()
+        if self._run_started_monotonic is not None:
+            execution_metadata["duration_seconds"] = time.monotonic() - self._run_started_monotonic
         return execution_metadata
 
+    @property
+    def _compress_reports(self) -> bool:
+        """Opt-in gzip output for run logs and reports (compress_reports runtime parameter)."""
+        return bool(self.runtime_parameters.get("compress_reports", False))
+
     def _persist_execution_log(self, execution_metadata: Dict):
         try:
             date_str = datetime.now().strftime("%Y-%m-%d")
-            output_dir = _PROJECT_ROOT / "output" / date_str
-            output_dir.mkdir(parents=True, exist_ok=True)
+            output_dir = _ensure_dir(str(_PROJECT_ROOT / "output" / date_str))
             run_label = self.run_id or "manual"
-            output_file = output_dir / f"run_{run_label}.json"
-            with open(output_file, "w", encoding="utf-8") as output_stream:
-                json.dump(execution_metadata, output_stream, indent=2, default=str)
+            payload, suffix = _dump_json(execution_metadata, self._compress_reports)
+            output_file = output_dir / f"run_{run_label}{suffix}"
+            output_file.write_bytes(payload)
             self.logger.info("Saved execution log to %s", output_file)
         except Exception as error:
             self.logger.error("Failed to save execution log to file: %s", error)
@@ -434,34 +610,37 @@ class EmailExtractionService:
         candidates_data = execution_metadata.get("candidates", [])
         run_summary = execution_metadata.get("summary", {})
 
-        total_emails_fetched = sum(c.get("emails_fetched", 0) for c in candidates_data)
-        total_duplicates = sum(c.get("duplicates_skipped", 0) for c in candidates_data)
-        total_non_vendor = sum(c.get("non_vendor_filtered", 0) for c in candidates_data)
+        # Fetch/duplicate/non-vendor totals were accumulated during Phase 1;
+        # one pass covers the remaining per-candidate totals and partitions.
+        total_emails_fetched = run_summary.get("total_emails_fetched", 0)
+        total_duplicates = run_summary.get("total_duplicates", 0)
+        total_non_vendor = run_summary.get("total_non_vendor", 0)
+        total_extracted = 0
+        total_passed_filters = 0
+        successful = []
+        failed = []
+        for c in candidates_data:
+            total_extracted += c.get("contacts_saved", 0)
+            total_passed_filters += (c.get("filter_stats") or {}).get("passed", 0)
+            (successful if c.get("status") == "success" else failed).append(c)
+
+        # Stops as soon as the cap is reached; later candidates' contact
+        # lists are never touched.
+        all_found_contacts = list(islice(
+            chain.from_iterable(c.get("extracted_contacts", ()) for c in candidates_data),
+            _REPORT_CONTACT_LIMIT,
+        ))
 
         # Use the bulk-save totals accumulated by _finalize_summary (set after
         # vendor_util.save_contacts runs) — NOT per-candidate emails_inserted
         # which is always 0 because saving happens after all candidates finish.
         total_contacts_inserted = run_summary.get("total_contacts_inserted", 0)
-        total_extracted = sum(c.get("contacts_saved", 0) for c in candidates_data)
-        total_passed_filters = sum(
-            (c.get("filter_stats") or {}).get("passed", 0) for c in candidates_data
-        )
         total_positions_inserted = run_summary.get("total_positions_inserted", 0)
         total_extracts_inserted = run_summary.get("total_extracts_inserted", 0)
 
-        successful = [c for c in candidates_data if c.get("status") == "success"]
-        failed = [c for c in candidates_data if c.get("status") != "success"]
-
         started = execution_metadata.get("started_at")
         finished = execution_metadata.get("finished_at")
-        duration_seconds = None
-        if started and finished:
-            try:
-                start_dt = datetime.fromisoformat(started.replace("Z", "+00:00"))
-                finish_dt = datetime.fromisoformat(finished.replace("Z", "+00:00"))
-                duration_seconds = (finish_dt - start_dt).total_seconds()
-            except Exception:
-                pass
+        duration_seconds = execution_metadata.get("duration_seconds")
 
         return {
             "run_metadata": {
@@ -487,10 +666,7 @@ class EmailExtractionService:
                 "positions_finalized": run_summary.get("total_finalized", 0),
                 "ner_fallback_inserted": run_summary.get("total_ner_fallback", 0),
             },
-            "all_found_contacts": [
-                contact for c in candidates_data 
-                for contact in c.get("extracted_contacts", [])
-            ][:500],  # Limit to 500 for safety
+            "all_found_contacts": all_found_contacts,  # Limited to 500 for safety
             "candidates": candidates_data,
             "successful_candidates": [c.get("candidate_email") for c in successful],
             "failed_candidates": [c.get("candidate_email") for c in failed],
@@ -508,17 +684,22 @@ class EmailExtractionService:
     def _save_json_report(self, report: Dict):
         """Save the JSON report to the output/reports directory."""
         try:
-            reports_dir = _PROJECT_ROOT / "output" / "reports"
-            reports_dir.mkdir(parents=True, exist_ok=True)
+            reports_dir = _ensure_dir(str(_PROJECT_ROOT / "output" / "reports"))
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            report_file = reports_dir / f"extraction_report_{timestamp}.json"
-            latest_report = reports_dir / "latest_extraction_report.json"
-
-            with open(report_file, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, default=str)
-            with open(latest_report, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, default=str)
+            payload, suffix = _dump_json(report, self._compress_reports)
+            report_file = reports_dir / f"extraction_report_{timestamp}{suffix}"
+            latest_report = reports_dir / f"latest_extraction_report{suffix}"
+
+            # Serialize once; "latest" is a hard link to the timestamped file.
+            # Both suffixes are cleared so toggling compression leaves no stale alias.
+            report_file.write_bytes(payload)
+            for stale_suffix in (".json", ".json.gz"):
+                (reports_dir / f"latest_extraction_report{stale_suffix}").unlink(missing_ok=True)
+            try:
+                os.link(report_file, latest_report)
+            except OSError:
+                shutil.copyfile(report_file, latest_report)
 
             self.logger.info("=" * 80)
             self.logger.info("📊 EXTRACTION REPORT SAVED")
@@ -543,23 +724,22 @@ class EmailExtractionService:
             self.logger.warning("Missing candidate_id for %s - skipping job activity log", email)
             return None
 
-        notes_parts = [
-            f"contacts_inserted={contacts_saved}",
-            f"positions_inserted={positions_saved}",
-            f"emails_fetched={emails_fetched}",
-        ]
+        notes = (
+            f"contacts_inserted={contacts_saved} | "
+            f"positions_inserted={positions_saved} | "
+            f"emails_fetched={emails_fetched}"
+        )
         if filter_stats:
-            notes_parts.append(
-                "filters="
+            notes += (
+                " | filters="
                 f"passed:{filter_stats.get('passed', 0)},"
                 f"junk:{filter_stats.get('junk', 0)},"
                 f"not_recruiter:{filter_stats.get('not_recruiter', 0)},"
                 f"calendar:{filter_stats.get('calendar_invites', 0)}"
             )
         if error_message:
-            notes_parts.append(f"error={error_message}")
+            notes += f" | error={error_message}"
 
-        notes = " | ".join(notes_parts)
         return {
             "candidate_id": candidate_id,
             "contacts_extracted": contacts_saved,
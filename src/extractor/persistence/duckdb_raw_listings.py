@@ -108,7 +108,7 @@ class RawJobListingsDuckDB:
         Insert a batch of raw_job_listings rows into DuckDB.
 
         Each row dict should match the payload built by
-        VendorUtil._build_raw_job_listings_payload().
+        VendorUtil._raw_job_listing_item().
 
         Returns:
             Number of rows successfully inserted.
@@ -4,16 +4,25 @@ vendor_contacts.py
 Persist extracted vendor/recruiter contacts plus raw job positions.
 
 Design:
-- save_contacts() is called ONCE by service.py after all candidates run.
+- service.py submits each candidate's contacts to a write buffer
+  (submit_contacts); save_contacts() runs once per flushed batch.
 - All three tables are populated in bulk:
-  1. automation_contact_extracts  (audit / dedup table) — via API (INSERT IGNORE)
+  1. automation_contact_extracts  (audit / dedup table) — via API (INSERT IGNORE);
+     raw_payload holds only the contact fields without a column of their
+     own, with long strings truncated on 'duplicate' rows
   2. vendor_contact via /api/vendor_contact/bulk
   3. raw_positions  via /api/raw-positions/bulk
 """
 
-from typing import Dict, List, Optional
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
-import json
+import re
+import threading
+
+import orjson
 
 from ..connectors.http_api import APIClient
 from ..filtering.repository import get_filter_repository
@@ -37,13 +46,98 @@ except Exception:
 logger = logging.getLogger(__name__)
 
 
+# Max emails per check-emails request; keeps each payload bounded on large runs.
+_CHECK_EMAILS_BATCH = 1000
+# Max rows per bulk write request (automation-extracts, vendor_contact); larger
+# INSERTs hold row locks longer on the backend and slow down rather than speed up.
+_BULK_CHUNK = 500
+# vendor_contact batches are sent by a small thread pool.
+_VENDOR_CONTACT_WORKERS = 4
+# submit_contacts flushes a partially filled buffer after this many seconds.
+_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Shared background pools, created on first use and flushed before process
+# exit: "automation-extracts" runs the audit insert alongside the
+# vendor_contact POSTs, "vendor-contact" sends those batches.
+_EXECUTORS: Dict[str, ThreadPoolExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+# (payload key, contact key) pairs copied into vendor_contact rows when non-empty.
+_VENDOR_CONTACT_FIELDS = (
+    ("source_email", "source"),
+    ("email", "email"),
+    ("phone", "phone"),
+    ("linkedin_id", "linkedin_id"),
+    ("company_name", "company"),
+    ("location", "location"),
+)
+
+# Contact fields already stored as automation_contact_extracts columns; the
+# row's raw_payload carries only the rest.
+_EXTRACT_COLUMN_FIELDS = frozenset(
+    ("name", "email", "phone", "company", "job_position", "location", "zip_code", "linkedin_id", "source")
+)
+# Duplicate audit rows cut raw_payload string values (typically raw_body)
+# to this many characters.
+_DUPLICATE_PAYLOAD_MAX_CHARS = 2048
+
+# Substrings that mark an address as a mailbox nobody answers.
+_BLOCKED_LOCAL_RE = re.compile(r"noreply|no-reply|info@|support@|admin@")
+
+_DIGIT_RE = re.compile(r"\d")
+
+
+def _shared_executor(name: str, max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared pool called name, creating it on first use."""
+    executor = _EXECUTORS.get(name)
+    if executor is None:
+        with _EXECUTORS_LOCK:
+            executor = _EXECUTORS.get(name)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+                atexit.register(executor.shutdown, wait=True)
+                _EXECUTORS[name] = executor
+    return executor
+
+
+def _iter_batches(items: Iterable, size: int) -> Iterator[List]:
+    """Yield consecutive lists of at most size items from any iterable."""
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 class VendorUtil:
     """Persist extracted vendor/recruiter contacts and related raw positions in bulk."""
 
+    # Process-wide snapshot of recent vendor emails, shared by every instance
+    # for RECENT_CACHE_TTL_SECONDS (monotonic clock).
+    RECENT_CACHE_TTL_SECONDS = 300
+    _recent_cache: frozenset = frozenset()
+    _recent_cache_at: float = 0.0
+    _recent_cache_lock = threading.Lock()
+
+    # Per-inbox existing-email snapshots expire after this long even when no
+    # save_contacts call clears them (long-lived services, other writers).
+    EXISTING_CACHE_TTL_SECONDS = 3600
+
     def __init__(self, api_client: APIClient):
         self.api_client = api_client
         self.logger = logging.getLogger(__name__)
         self.filter_repo = get_filter_repository()
+        # Emails known to exist globally (from the warm-up snapshot); these
+        # never need another check-emails round-trip in save_contacts.
+        # Normalised emails are interned throughout this class, so the same
+        # address shares one string (and its cached hash) across every set.
+        self._known_global_emails: frozenset = frozenset()
+        # Per-inbox (monotonic fetch time, existing emails), cleared once
+        # save_contacts writes new rows.
+        self._existing_by_source: Dict[str, Tuple[float, frozenset]] = {}
+        # Write buffer filled by submit_contacts and drained by flush_contacts.
+        self._pending_contacts: List[Dict] = []
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._last_flush_at = time.monotonic()
 
     # ─────────────────────────────────────────────────────────────────────────
     # Deduplication helpers — now use API calls instead of raw SQL
@@ -52,73 +146,156 @@ class VendorUtil:
     def get_existing_emails(self, source_email: str) -> set:
         """
         Fetch existing vendor emails for this candidate to avoid re-inserting.
-        Calls GET /api/automation-extracts?source_email=<email>
+        Calls GET /api/automation-extracts?source_email=<email> once per inbox;
+        repeat calls within EXISTING_CACHE_TTL_SECONDS are served from an
+        instance cache. Returns a fresh set the caller may mutate.
         """
         if not source_email:
             return set()
+        cached = self._existing_by_source.get(source_email)
+        if cached is not None and time.monotonic() - cached[0] < self.EXISTING_CACHE_TTL_SECONDS:
+            return set(cached[1])
         try:
             response = self.api_client.get(
                 f"/api/automation-extracts?source_email={source_email}"
             )
             records = response if isinstance(response, list) else (response or {}).get("data", [])
-            existing = {r["email"].strip().lower() for r in records if r.get("email")}
+            existing = {sys.intern(r["email"].strip().lower()) for r in records if r.get("email")}
+            self._existing_by_source[source_email] = (time.monotonic(), frozenset(existing))
             self.logger.info("Loaded %d existing contacts for deduplication", len(existing))
             return existing
         except Exception as e:
             self.logger.error("Failed to fetch existing contacts: %s", e)
             return set()
 
-    def get_recent_vendor_emails(self, limit: int = 5000) -> set:
+    def get_recent_vendor_emails(self, limit: int = 5000) -> frozenset:
         """
         Fetch recently extracted unique vendor emails for global deduplication cache.
-        Falls back to get_globally_existing_emails() with an empty list — the caller
-        should use get_globally_existing_emails() directly for a targeted check.
+        The result is cached on the class for RECENT_CACHE_TTL_SECONDS so
+        repeated runs in one process share a single fetch.
         """
-        try:
-            # Note: The backend endpoint might not support limit/order_by yet, 
-            # but we use the general automation-extracts endpoint.
-            response = self.api_client.get(
-                f"/api/automation-extracts"
-            )
-            records = response if isinstance(response, list) else (response or {}).get("data", [])
-            existing = {r["email"].strip().lower() for r in records if r.get("email")}
-            self.logger.info("Loaded %d global vendor emails for cache", len(existing))
-            return existing
-        except Exception as e:
-            self.logger.error("Failed to fetch global vendor cache: %s", e)
-            return set()
-
-    def get_globally_existing_emails(self, emails: List[str]) -> set:
+        cls = type(self)
+        with cls._recent_cache_lock:
+            if cls._recent_cache and time.monotonic() - cls._recent_cache_at < cls.RECENT_CACHE_TTL_SECONDS:
+                self.logger.info("Reusing %d cached global vendor emails", len(cls._recent_cache))
+                self.add_known_global_emails(cls._recent_cache)
+                return cls._recent_cache
+            try:
+                # Note: The backend endpoint might not support limit/order_by yet, 
+                # but we use the general automation-extracts endpoint.
+                response = self.api_client.get(
+                    f"/api/automation-extracts"
+                )
+                records = response if isinstance(response, list) else (response or {}).get("data", [])
+                existing = frozenset(sys.intern(r["email"].strip().lower()) for r in records if r.get("email"))
+                self.add_known_global_emails(existing)
+                self.logger.info("Loaded %d global vendor emails for cache", len(existing))
+                if existing:
+                    cls._recent_cache = existing
+                    cls._recent_cache_at = time.monotonic()
+                return existing
+            except Exception as e:
+                self.logger.error("Failed to fetch global vendor cache: %s", e)
+                return frozenset()
+
+    def add_known_global_emails(self, emails) -> None:
+        """Record emails known to exist globally so save_contacts can skip checking them."""
+        self._known_global_emails = self._known_global_emails | frozenset(emails)
+
+    def get_globally_existing_emails(self, emails: List[str]) -> frozenset:
         """
         Check which emails from the provided list already exist globally.
-        Calls POST /api/automation-extracts/check-emails — one bulk API call.
+        Emails already known to exist are answered from memory; the rest go to
+        POST /api/automation-extracts/check-emails in batches of
+        _CHECK_EMAILS_BATCH unique emails. Hits are remembered for later calls.
         """
         if not emails:
-            return set()
-        try:
-            response = self.api_client.post(
-                "/api/automation-extracts/check-emails",
-                {"emails": emails},
+            return frozenset()
+        known = self._known_global_emails
+        existing = set()
+        unknown_emails = []
+        for email in dict.fromkeys(emails):
+            if email in known:
+                existing.add(email)
+            else:
+                unknown_emails.append(email)
+
+        found_remote = set()
+        for batch in _iter_batches(unknown_emails, _CHECK_EMAILS_BATCH):
+            try:
+                response = self.api_client.post(
+                    "/api/automation-extracts/check-emails",
+                    {"emails": batch},
+                )
+                found = response.get("existing_emails", []) if isinstance(response, dict) else []
+                found_remote.update(sys.intern(e.strip().lower()) for e in found if e)
+            except Exception as e:
+                self.logger.error("Failed to check global existing emails: %s", e)
+        if found_remote:
+            self.add_known_global_emails(found_remote)
+        return frozenset(existing | found_remote)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Write buffer — lets callers persist contacts while extraction continues
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def submit_contacts(
+        self,
+        contacts: List[Dict],
+        seen_keys: Optional[set] = None,
+        flush_size: int = _BULK_CHUNK,
+        flush_interval: float = _FLUSH_INTERVAL_SECONDS,
+    ) -> Dict[str, int]:
+        """
+        Buffer contacts and save them once flush_size are pending or
+        flush_interval seconds have passed since the last flush. The interval
+        is only checked on submit; callers drain the rest with flush_contacts.
+        Returns the counts of the flush this call triggered, else an empty dict.
+        """
+        with self._pending_lock:
+            self._pending_contacts.extend(contacts)
+            pending = len(self._pending_contacts)
+            due = pending >= flush_size or (
+                pending and time.monotonic() - self._last_flush_at >= flush_interval
             )
-            found = response.get("existing_emails", []) if isinstance(response, dict) else []
-            return {e.strip().lower() for e in found if e}
-        except Exception as e:
-            self.logger.error("Failed to check global existing emails: %s", e)
-            return set()
+        if not due:
+            return {}
+        return self.flush_contacts(seen_keys=seen_keys)
+
+    def flush_contacts(self, seen_keys: Optional[set] = None) -> Dict[str, int]:
+        """
+        Save every buffered contact now. Flushes are serialized so a shared
+        seen_keys set keeps dedup across all of them.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending_contacts = self._pending_contacts, []
+                self._last_flush_at = time.monotonic()
+            if not batch:
+                return {}
+            return self.save_contacts(batch, seen_keys=seen_keys)
 
     # ─────────────────────────────────────────────────────────────────────────
-    # Main entry point — called ONCE after all candidates have been processed
+    # Main entry point — called per flushed batch of candidate results
     # ─────────────────────────────────────────────────────────────────────────
 
-    def save_contacts(self, contacts: List[Dict], candidate_id: Optional[int] = None) -> Dict[str, int]:
+    def save_contacts(
+        self,
+        contacts: List[Dict],
+        candidate_id: Optional[int] = None,
+        seen_keys: Optional[set] = None,
+    ) -> Dict[str, int]:
         """
         Bulk-save all extracted contacts to three destinations:
-          1. automation_contact_extracts  (INSERT IGNORE — audit/dedup table)
+          1. automation_contact_extracts  (INSERT IGNORE — audit/dedup table;
+             emails already known from the warm-up snapshot are not re-sent)
           2. vendor_contact via API        (truly new contacts only)
           3. raw_positions  via API        (truly new contacts only)
 
-        contacts is the flat list accumulated from ALL candidate runs.
+        contacts is a batch of contacts from one or more candidate runs.
         Each contact dict may carry a 'candidate_id' key set by candidate_runner.
+        When the caller saves in chunks, it passes the same seen_keys set to
+        every call so local dedup spans the whole run.
 
         Returns dict with insert / skip counts.
         """
@@ -137,76 +314,133 @@ class VendorUtil:
             return result
 
         # ── Step 1: Validate and local-dedup ─────────────────────────────────
+        # Each email is normalised once here; filtered_emails stays aligned
+        # with filtered_contacts so later steps never re-normalise. Emails in
+        # the warm-up snapshot were read from the audit table itself, so they
+        # are skipped before any validation work; the rest are collected for
+        # the check-emails round-trip.
         filtered_contacts: List[Dict] = []
-        seen_keys: set = set()
-
-        for contact in contacts:
-            if not self._is_valid_contact(contact):
-                result["contacts_skipped"] += 1
+        filtered_emails: List[str] = []
+        known = self._known_global_emails
+        unknown_emails: List[str] = []
+        if seen_keys is None:
+            seen_keys = set()
+        normalized = [sys.intern((c.get("email") or "").strip().lower()) for c in contacts]
+        # Filter rules are only needed for contacts that survive the known-email skip.
+        filter_actions = self.filter_repo.check_emails_bulk(e for e in normalized if e not in known)
+
+        # Hot loop: bind bound methods to locals once.
+        is_valid = self._is_valid_contact
+        is_vendor = self._is_vendor_recruiter_contact
+        seen_add = seen_keys.add
+        keep_contact = filtered_contacts.append
+        keep_email = filtered_emails.append
+        skipped = 0
+
+        for contact, email_key in zip(contacts, normalized):
+            if email_key and email_key in known:
+                skipped += 1
+                # Still claim its LinkedIn id so LinkedIn-only repeats are caught
+                linkedin_id = contact.get("linkedin_id")
+                if linkedin_id and linkedin_id.strip():
+                    seen_add(f"li:{linkedin_id.strip().lower()}")
                 continue
-            if not self._is_vendor_recruiter_contact(contact):
-                result["contacts_skipped"] += 1
+            if not is_valid(contact, email_key) or not is_vendor(contact, email_key, filter_actions):
+                skipped += 1
                 continue
 
-            email_key = (contact.get("email") or "").strip().lower()
+            # A contact repeats an earlier one if either its email or its
+            # LinkedIn id was already seen; LinkedIn keys carry an "li:" prefix.
             linkedin_key = (contact.get("linkedin_id") or "").strip().lower()
-            dedupe_key = email_key or f"li:{linkedin_key}"
-            if dedupe_key and dedupe_key in seen_keys:
-                result["contacts_skipped"] += 1
+            li_key = f"li:{linkedin_key}" if linkedin_key else ""
+            if (email_key and email_key in seen_keys) or (li_key and li_key in seen_keys):
+                skipped += 1
                 continue
-            if dedupe_key:
-                seen_keys.add(dedupe_key)
+            if email_key:
+                seen_add(email_key)
+            if li_key:
+                seen_add(li_key)
 
-            filtered_contacts.append(contact)
+            keep_contact(contact)
+            keep_email(email_key)
+            if email_key:
+                unknown_emails.append(email_key)
+        result["contacts_skipped"] += skipped
 
         if not filtered_contacts:
             self.logger.info("No vendor/recruiter contacts after validation")
             return result
 
         # ── Step 2: Global DB dedup ──────────────────────────────────────────
-        candidate_emails = [
-            c.get("email").strip().lower()
-            for c in filtered_contacts
-            if c.get("email")
-        ]
-        existing_global_emails = self.get_globally_existing_emails(candidate_emails)
-
-        truly_new_contacts = [
-            c for c in filtered_contacts
-            if (c.get("email") or "").strip().lower() not in existing_global_emails
-        ]
+        existing_global_emails = self.get_globally_existing_emails(unknown_emails)
+
+        # One pass builds every payload: the audit row for each filtered
+        # contact, plus vendor_contact and raw_job_listings rows for new ones.
+        extract_rows: List[Dict] = []
+        truly_new_contacts: List[Dict] = []
+        bulk_contacts: List[Dict] = []
+        raw_job_listings: List[Dict] = []
+        today = datetime.now().date().isoformat()
+        for contact, email_key in zip(filtered_contacts, filtered_emails):
+            is_duplicate = email_key in existing_global_emails
+            extract_rows.append(self._contact_extract_row(contact, is_duplicate))
+            if is_duplicate:
+                continue
+            truly_new_contacts.append(contact)
+            vendor_item = self._vendor_contact_item(contact, today)
+            if vendor_item is not None:
+                bulk_contacts.append(vendor_item)
+            listing = self._raw_job_listing_item(contact)
+            if listing is not None:
+                raw_job_listings.append(listing)
         result["contacts_skipped"] += len(filtered_contacts) - len(truly_new_contacts)
 
         # ── Step 3: Bulk INSERT IGNORE → automation_contact_extracts ─────────
-        # ALL filtered contacts are recorded (new ones as 'new', duplicates
-        # are silently ignored by INSERT IGNORE via the unique index).
-        ext_inserted, ext_skipped = self._bulk_insert_contact_extracts(filtered_contacts, existing_global_emails)
-        result["extracts_inserted"] = ext_inserted
-        result["extracts_skipped"] = ext_skipped
-
-        if not truly_new_contacts:
-            self.logger.info("No truly new contacts — all duplicates recorded in audit table.")
-            return result
+        # Every filtered contact is recorded (new ones as 'new', duplicates
+        # as 'duplicate', which INSERT IGNORE drops when the unique index
+        # already has the row). Contacts skipped in Step 1 as warm-up-known
+        # get no row: the snapshot was read from this table, so theirs exists.
+        # The insert runs in the background so Step 4 does not wait on it.
+        extracts_future = _shared_executor("automation-extracts", 2).submit(
+            self._bulk_insert_contact_extracts, extract_rows
+        )
+        try:
+            if truly_new_contacts:
+                self._save_new_contacts(truly_new_contacts, bulk_contacts, raw_job_listings, result)
+            else:
+                self.logger.info("No truly new contacts — all duplicates recorded in audit table.")
+        finally:
+            ext_inserted, ext_skipped = extracts_future.result()
+            result["extracts_inserted"] = ext_inserted
+            result["extracts_skipped"] = ext_skipped
+            # The audit table just changed, so per-inbox snapshots are stale.
+            self._existing_by_source.clear()
+
+        return result
 
+    def _save_new_contacts(
+        self,
+        truly_new_contacts: List[Dict],
+        bulk_contacts: List[Dict],
+        raw_job_listings: List[Dict],
+        result: Dict[str, int],
+    ) -> None:
+        """
+        Steps 4-6 of save_contacts for contacts not yet known globally.
+        Counts are added to result in place; stops after Step 4 if the
+        vendor_contact POST fails.
+        """
         # ── Step 4: Bulk POST → vendor_contact API ────────────────────────────
-        bulk_contacts = self._build_vendor_contacts_payload(truly_new_contacts)
         if bulk_contacts:
-            try:
-                self.logger.info("Sending %s contacts to /api/vendor_contact/bulk", len(bulk_contacts))
-                response = self.api_client.post("/api/vendor_contact/bulk", {"contacts": bulk_contacts})
-                inserted, skipped = self._extract_insert_skip_counts(response, default_inserted=len(bulk_contacts))
-                result["contacts_inserted"] = inserted
-                result["contacts_skipped"] += skipped
-            except Exception as error:
-                self.logger.error("API error saving vendor contacts: %s", error)
-                return result
+            self.logger.info("Sending %s contacts to /api/vendor_contact/bulk", len(bulk_contacts))
+            if not self._post_vendor_contacts(bulk_contacts, result):
+                return
         else:
             self.logger.info("No contacts prepared for vendor_contact bulk insert")
 
         # ── Step 5: raw_job_listings ──────────────────────────────────────────
         # candidate_id may be None (run across multiple candidates) — each
         # contact carries its own 'candidate_id' set by candidate_runner.
-        raw_job_listings = self._build_raw_job_listings_payload(truly_new_contacts)
         if raw_job_listings:
             # ── Step 5a: Local DuckDB only (API path disabled for now) ────────
             # TODO: When ready to push to production, uncomment Step 5b below.
@@ -226,11 +460,10 @@ class VendorUtil:
                 # ── Auto-generate duckdb_logs.json ────────────────────────
                 if _HAS_DUCKDB_LOG:
                     try:
-                        import json as _json
                         log_path = _write_duckdb_log()
                         self.logger.info("DuckDB log written → %s", log_path)
                         # Print colored summary to terminal so user sees results immediately
-                        _log_data = _json.loads(log_path.read_text(encoding="utf-8"))
+                        _log_data = orjson.loads(log_path.read_bytes())
                         _print_duckdb_summary(_log_data)
                         run_num = _log_data.get("run_number", "?")
                         print(f"  ✓ DuckDB run #{run_num} log saved → {log_path.name}")
@@ -321,8 +554,6 @@ class VendorUtil:
                 "ner_fallback": ner_fallback_positions
             }, result)
 
-        return result
-
     # ─────────────────────────────────────────────────────────────────────────
     # Mapping Helpers for NER Path
     # ─────────────────────────────────────────────────────────────────────────
@@ -399,6 +630,11 @@ class VendorUtil:
                     continue
                     
                 filename = output_dir / f"extraction_{category}_{timestamp}.json"
+                # Chunked saves can land in the same second; never overwrite
+                suffix = 2
+                while filename.exists():
+                    filename = output_dir / f"extraction_{category}_{timestamp}_{suffix}.json"
+                    suffix += 1
                 
                 result_package = {
                     "summary": {
@@ -412,8 +648,7 @@ class VendorUtil:
                     "records": data
                 }
                 
-                with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(result_package, f, indent=2, ensure_ascii=False)
+                filename.write_bytes(orjson.dumps(result_package, option=orjson.OPT_INDENT_2))
                 self.logger.info("Saved %s records to: %s", category, filename)
                 
         except Exception as e:
@@ -423,123 +658,155 @@ class VendorUtil:
     # Bulk API insert — automation_contact_extracts
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _bulk_insert_contact_extracts(
-        self,
-        contacts: List[Dict],
-        existing_global_emails: set,
-    ) -> tuple[int, int]:
+    @staticmethod
+    def _contact_extract_row(contact: Dict, is_duplicate: bool) -> Dict:
+        """
+        Map one contact to an automation_contact_extracts row. raw_payload keeps
+        only the fields that have no column of their own; for duplicates, long
+        string values (typically raw_body) are truncated to
+        _DUPLICATE_PAYLOAD_MAX_CHARS characters.
         """
-        Bulk-insert all contacts into automation_contact_extracts via API.
+        raw_payload = {k: v for k, v in contact.items() if k not in _EXTRACT_COLUMN_FIELDS}
+        if is_duplicate:
+            for key, value in raw_payload.items():
+                if isinstance(value, str) and len(value) > _DUPLICATE_PAYLOAD_MAX_CHARS:
+                    raw_payload[key] = value[:_DUPLICATE_PAYLOAD_MAX_CHARS]
+        return {
+            "full_name":       contact.get("name"),
+            "email":           contact.get("email"),
+            "phone":           contact.get("phone"),
+            "company_name":    contact.get("company"),
+            "job_title":       contact.get("job_position"),
+            "city":            contact.get("location"),
+            "postal_code":     contact.get("zip_code"),
+            "linkedin_id":     contact.get("linkedin_id"),
+            "source_type":     "email",
+            "source_reference": contact.get("source"),
+            "raw_payload":     raw_payload,
+            "processing_status": "duplicate" if is_duplicate else "new",
+            "classification":  "unknown",
+        }
+
+    def _bulk_insert_contact_extracts(self, rows: List[Dict]) -> tuple[int, int]:
+        """
+        Bulk-insert audit rows into automation_contact_extracts via API.
         The backend does INSERT IGNORE so duplicates are silently skipped.
+        Emails from batches that fully succeed become known global emails.
         Returns (inserted, skipped).
         """
-        if not contacts:
+        if not rows:
             return 0, 0
 
-        rows = []
-        for contact in contacts:
-            email_lc = (contact.get("email") or "").strip().lower()
-            status = "duplicate" if email_lc in existing_global_emails else "new"
-            rows.append({
-                "full_name":       contact.get("name"),
-                "email":           contact.get("email"),
-                "phone":           contact.get("phone"),
-                "company_name":    contact.get("company"),
-                "job_title":       contact.get("job_position"),
-                "city":            contact.get("location"),
-                "postal_code":     contact.get("zip_code"),
-                "linkedin_id":     contact.get("linkedin_id"),
-                "source_type":     "email",
-                "source_reference": contact.get("source"),
-                "raw_payload":     contact,
-                "processing_status": status,
-                "classification":  "unknown",
-            })
-
-        try:
-            response = self.api_client.post(
-                "/api/automation-extracts/bulk",
-                {"extracts": rows},
-            )
-            if isinstance(response, dict):
-                inserted = response.get("inserted", 0)
-                duplicates = response.get("duplicates", 0)
-                failed = response.get("failed", 0)
-                self.logger.info(
-                    "automation-extracts bulk: %d rows → %d inserted, %d duplicates, %d failed",
-                    response.get("total", len(rows)),
-                    inserted,
-                    duplicates,
-                    failed,
+        inserted_total = skipped_total = 0
+        for batch in _iter_batches(rows, _BULK_CHUNK):
+            try:
+                response = self.api_client.post(
+                    "/api/automation-extracts/bulk",
+                    {"extracts": batch},
                 )
-                return inserted, (duplicates + failed)
-        except Exception as e:
-            self.logger.error("Error in audit bulk insert: %s", e)
-        
-        return 0, len(rows)  # Default on error
+                if isinstance(response, dict):
+                    inserted = response.get("inserted", 0)
+                    duplicates = response.get("duplicates", 0)
+                    failed = response.get("failed", 0)
+                    self.logger.info(
+                        "automation-extracts bulk: %d rows → %d inserted, %d duplicates, %d failed",
+                        response.get("total", len(batch)),
+                        inserted,
+                        duplicates,
+                        failed,
+                    )
+                    inserted_total += inserted
+                    skipped_total += duplicates + failed
+                    if not failed:
+                        # Every email in the batch is now in the audit table;
+                        # later saves in this process skip them in Step 1.
+                        self.add_known_global_emails(
+                            sys.intern(row["email"].strip().lower()) for row in batch if row.get("email")
+                        )
+                    continue
+            except Exception as e:
+                self.logger.error("Error in audit bulk insert: %s", e)
+            skipped_total += len(batch)  # Default on error
 
+        return inserted_total, skipped_total
+
+
+    def _post_vendor_contacts(self, bulk_contacts: Iterable[Dict], result: Dict[str, int]) -> bool:
+        """
+        POST vendor contacts in batches of _BULK_CHUNK, several at a
+        time, adding the counts to result. Returns False if any batch failed.
+        """
+        def post(batch: List[Dict]):
+            response = self.api_client.post("/api/vendor_contact/bulk", {"contacts": batch})
+            return self._extract_insert_skip_counts(response, default_inserted=len(batch))
+
+        ok = True
+        pool = _shared_executor("vendor-contact", _VENDOR_CONTACT_WORKERS)
+        futures = [pool.submit(post, batch) for batch in _iter_batches(bulk_contacts, _BULK_CHUNK)]
+        for future in futures:
+            try:
+                inserted, skipped = future.result()
+            except Exception as error:
+                self.logger.error("API error saving vendor contacts: %s", error)
+                ok = False
+                continue
+            result["contacts_inserted"] += inserted
+            result["contacts_skipped"] += skipped
+        return ok
 
     # ─────────────────────────────────────────────────────────────────────────
     # Payload builders
     # ─────────────────────────────────────────────────────────────────────────
 
-    def _build_vendor_contacts_payload(self, contacts: List[Dict]) -> List[Dict]:
-        payload = []
-        for contact in contacts:
-            full_name = (contact.get("name") or "").strip()
-            if not full_name:
-                continue
-            item = {
-                "full_name": full_name,
-                "source_email": contact.get("source"),
-                "email": contact.get("email"),
-                "phone": contact.get("phone"),
-                "linkedin_id": contact.get("linkedin_id"),
-                "company_name": contact.get("company"),
-                "location": contact.get("location"),
-                "extraction_date": datetime.now().date().isoformat(),
-                "job_source": "Bot Candidate Email Extractor",
-            }
-            item = {k: v for k, v in item.items() if v not in (None, "")}
-            if "full_name" in item:
-                payload.append(item)
-        return payload
-
-    def _build_raw_job_listings_payload(self, contacts: List[Dict]) -> List[Dict]:
-        """Build one raw job listing per contact that has job-content signals."""
-        payload = []
-        for contact in contacts:
-            has_position_signal = any(
-                contact.get(field) for field in ("job_position", "raw_body", "location", "company")
-            )
-            if not has_position_signal:
-                continue
-
-            # Use the candidate_id tagged per-contact by candidate_runner
-            cid = contact.get("candidate_id")
-
-            contact_info = {
-                "name": contact.get("name"),
-                "email": contact.get("email"),
-                "phone": contact.get("phone"),
-                "linkedin": contact.get("linkedin_id"),
-            }
-            payload.append({
-                "candidate_id": cid,
-                "source": "email",
-                "source_uid": contact.get("extracted_from_uid"),
-                "extractor_version": "v1.0",
-                "raw_title": contact.get("job_position"),
-                "raw_company": contact.get("company"),
-                "raw_location": contact.get("location"),
-                "raw_zip": contact.get("zip_code"),
-                "raw_description": contact.get("raw_body"),
-                "raw_contact_info": json.dumps(contact_info),
-                "raw_notes": f"Extracted from {contact.get('extraction_source')}",
-                "raw_payload": contact,
-                "processing_status": "new",
-            })
-        return payload
+    @staticmethod
+    def _vendor_contact_item(contact: Dict, today: str) -> Optional[Dict]:
+        """Map one contact to a vendor_contact row, or None without a name."""
+        full_name = (contact.get("name") or "").strip()
+        if not full_name:
+            return None
+        # Only non-empty fields are sent; build the dict once, skipping blanks.
+        item = {"full_name": full_name}
+        for key, field in _VENDOR_CONTACT_FIELDS:
+            value = contact.get(field)
+            if value is not None and value != "":
+                item[key] = value
+        item["extraction_date"] = today
+        item["job_source"] = "Bot Candidate Email Extractor"
+        return item
+
+    @staticmethod
+    def _raw_job_listing_item(contact: Dict) -> Optional[Dict]:
+        """Map one contact to a raw job listing, or None without job-content signals."""
+        if not (
+            contact.get("job_position")
+            or contact.get("raw_body")
+            or contact.get("location")
+            or contact.get("company")
+        ):
+            return None
+
+        contact_info = {
+            "name": contact.get("name"),
+            "email": contact.get("email"),
+            "phone": contact.get("phone"),
+            "linkedin": contact.get("linkedin_id"),
+        }
+        # Use the candidate_id tagged per-contact by candidate_runner
+        return {
+            "candidate_id": contact.get("candidate_id"),
+            "source": "email",
+            "source_uid": contact.get("extracted_from_uid"),
+            "extractor_version": "v1.0",
+            "raw_title": contact.get("job_position"),
+            "raw_company": contact.get("company"),
+            "raw_location": contact.get("location"),
+            "raw_zip": contact.get("zip_code"),
+            "raw_description": contact.get("raw_body"),
+            "raw_contact_info": orjson.dumps(contact_info).decode(),
+            "raw_notes": f"Extracted from {contact.get('extraction_source')}",
+            "raw_payload": contact,
+            "processing_status": "new",
+        }
 
     # ─────────────────────────────────────────────────────────────────────────
     # Helpers
@@ -552,21 +819,33 @@ class VendorUtil:
             return inserted, skipped
         return default_inserted, 0
 
-    def _is_vendor_recruiter_contact(self, contact: Dict) -> bool:
+    def _is_vendor_recruiter_contact(
+        self,
+        contact: Dict,
+        contact_email: Optional[str] = None,
+        filter_actions: Optional[Dict[str, Optional[str]]] = None,
+    ) -> bool:
         source_email = (contact.get("source") or "").strip().lower()
-        contact_email = (contact.get("email") or "").strip().lower()
+        if contact_email is None:
+            contact_email = (contact.get("email") or "").strip().lower()
         if source_email and contact_email and source_email == contact_email:
             return False
         if contact_email:
-            action = self.filter_repo.check_email(contact_email)
+            if filter_actions is not None and contact_email in filter_actions:
+                action = filter_actions[contact_email]
+            else:
+                action = self.filter_repo.check_email(contact_email)
             if action == "block":
                 return False
         return True
 
-    def _is_valid_contact(self, contact: Dict) -> bool:
-        """Validate contact has minimum required quality."""
+    def _is_valid_contact(self, contact: Dict, email_lc: Optional[str] = None) -> bool:
+        """
+        Validate contact has minimum required quality. email_lc is the
+        contact's stripped, lowercased email when the caller already has it.
+        """
         try:
-            email = (contact.get("email") or "").strip()
+            email = email_lc if email_lc is not None else (contact.get("email") or "").strip().lower()
             linkedin = (contact.get("linkedin_id") or "").strip()
             name = (contact.get("name") or "").strip()
 
@@ -576,9 +855,7 @@ class VendorUtil:
             if email:
                 if "@" not in email or "." not in email:
                     return False
-                email_lower = email.lower()
-                blocked_local_parts = ["noreply", "no-reply", "info@", "support@", "admin@"]
-                if any(token in email_lower for token in blocked_local_parts):
+                if _BLOCKED_LOCAL_RE.search(email):
                     return False
 
             if linkedin and (" " in linkedin or len(linkedin) > 80):
@@ -588,7 +865,7 @@ class VendorUtil:
                 words = name.split()
                 if len(words) < 2 or len(words) > 6:
                     return False
-                if any(char.isdigit() for char in name):
+                if _DIGIT_RE.search(name):
                     return False
             return True
         except Exception as error:
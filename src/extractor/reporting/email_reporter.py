@@ -8,9 +8,23 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class NullEmailReporter:
+    """Stand-in used when SMTP settings are incomplete; sends nothing."""
+
+    enabled = False
+
+    def __init__(self):
+        logger.warning("Email reporting configuration is incomplete. Email reports will be disabled.")
+
+    def send_report(self, report: Dict):
+        logger.info("Email reporting is disabled. Skipping report email.")
+
+
 class EmailReporter:
     """Sends a single comprehensive extraction report via SMTP after all candidates are processed."""
 
+    REQUIRED_KEYS = ("SMTP_SERVER", "SMTP_USERNAME", "SMTP_PASSWORD", "REPORT_FROM_EMAIL", "REPORT_TO_EMAIL")
+
     def __init__(self, config: Dict):
         self.smtp_server = config.get("SMTP_SERVER")
         self.smtp_port = int(config.get("SMTP_PORT", 587))
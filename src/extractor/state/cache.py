@@ -1,5 +1,6 @@
 from typing import Set, Optional
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,8 @@ class DeduplicationCache:
         self.seen_emails_run: Set[str] = set()
         self.known_db_emails: Set[str] = set()
         self._db_cache_populated = False
+        # Candidate runners may share this cache across worker threads
+        self._lock = threading.Lock()
 
     def is_seen_in_run(self, email: str) -> bool:
         """Check if an email has already been processed in the current run."""
@@ -32,18 +35,35 @@ class DeduplicationCache:
     def mark_seen_in_run(self, email: str):
         """Mark an email as processed in the current run."""
         if email:
-            self.seen_emails_run.add(email.strip().lower())
+            with self._lock:
+                self.seen_emails_run.add(email.strip().lower())
+
+    def claim_in_run(self, email: str) -> bool:
+        """
+        Atomically mark an email as seen in the current run.
+        Returns False if another runner already claimed it.
+        """
+        if not email:
+            return True
+        normalized = email.strip().lower()
+        with self._lock:
+            if normalized in self.seen_emails_run:
+                return False
+            self.seen_emails_run.add(normalized)
+            return True
 
     def add_known_db_emails(self, emails: Set[str]):
         """Add a batch of known emails from the database to the cache."""
         normalized = {e.strip().lower() for e in emails if e}
-        self.known_db_emails.update(normalized)
-        self._db_cache_populated = True
+        with self._lock:
+            self.known_db_emails.update(normalized)
+            self._db_cache_populated = True
         logger.debug(f"Added {len(normalized)} emails to DB deduplication cache. Total: {len(self.known_db_emails)}")
 
     def clear_run_cache(self):
         """Clear the intra-run cache (e.g., between distinct workflows if reused)."""
-        self.seen_emails_run.clear()
+        with self._lock:
+            self.seen_emails_run.clear()
         
     def get_stats(self) -> dict:
         return {
@@ -9,9 +9,10 @@ backend API, so that we never re-process emails already handled.
 
 import json
 import os
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,6 +42,8 @@ class UIDTracker:
         self.tracker_file = Path(tracker_file)
         self.api_client = api_client
         self.workflow_id = workflow_id
+        # Guards self.data and the file write; candidate runners update concurrently
+        self._lock = threading.RLock()
         self.data = self._load()
         self.logger = logging.getLogger(__name__)
 
@@ -151,8 +154,13 @@ class UIDTracker:
         """Save last run data to JSON file"""
         try:
             self.tracker_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.tracker_file, "w") as f:
-                json.dump(self.data, f, indent=2, sort_keys=True)
+            # Write to a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated last_run.json behind.
+            tmp_file = self.tracker_file.with_name(self.tracker_file.name + ".tmp")
+            with self._lock:
+                with open(tmp_file, "w") as f:
+                    json.dump(self.data, f, indent=2, sort_keys=True)
+                os.replace(tmp_file, self.tracker_file)
             logger.debug("Saved last_run.json with %d accounts", len(self.data))
         except Exception as e:
             logger.error("Error saving %s: %s", self.tracker_file, e)
@@ -189,13 +197,38 @@ class UIDTracker:
             uid:             Last processed UID
             force_timestamp: If True, always update last_run even if UID hasn't advanced.
         """
+        with self._lock:
+            if self._apply_update(email, uid, force_timestamp):
+                self._save()
+
+    def update_last_uids_bulk(self, updates: Dict[str, Tuple[str, bool]]) -> int:
+        """
+        Apply many UID updates and write last_run.json once.
+
+        Args:
+            updates: {email: (uid, force_timestamp)}
+
+        Returns:
+            Number of accounts whose entry changed.
+        """
+        with self._lock:
+            changed = sum(
+                1 for email, (uid, force_timestamp) in updates.items()
+                if self._apply_update(email, uid, force_timestamp)
+            )
+            if changed:
+                self._save()
+        return changed
+
+    def _apply_update(self, email: str, uid: str, force_timestamp: bool) -> bool:
+        """Update the in-memory entry for one account; returns True if it changed."""
         email = email.strip().lower()
 
         try:
             new_uid_int = int(uid)
         except (ValueError, TypeError):
             logger.warning("Invalid UID format for update: %s for %s", uid, email)
-            return
+            return False
 
         current_data = self.data.get(email)
         if current_data:
@@ -206,14 +239,13 @@ class UIDTracker:
                     # but still refresh the last_run timestamp if forced.
                     if force_timestamp:
                         self.data[email]["last_run"] = datetime.now().isoformat()
-                        self._save()
                         logger.debug("Updated timestamp only for %s (UID not advanced)", email)
-                    else:
-                        logger.debug(
-                            "Skipping UID update for %s: stored %s > new %s",
-                            email, last_uid_str, uid,
-                        )
-                    return
+                        return True
+                    logger.debug(
+                        "Skipping UID update for %s: stored %s > new %s",
+                        email, last_uid_str, uid,
+                    )
+                    return False
             except (ValueError, TypeError):
                 pass  # Corrupted stored UID — allow overwrite
 
@@ -221,8 +253,8 @@ class UIDTracker:
             "last_uid": str(uid),
             "last_run": datetime.now().isoformat(),
         }
-        self._save()
         logger.info("Updated %s: last_uid=%s", email, uid)
+        return True
 
     def get_all_tracked_accounts(self) -> list:
         """Get list of all tracked email accounts"""
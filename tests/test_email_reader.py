@@ -0,0 +1,107 @@
+"""
+Tests for EmailReader multi-UID fetches (batch split and reconnect).
+
+    python -m pytest tests/test_email_reader.py -v
+"""
+
+import imaplib
+import unittest
+from unittest.mock import patch
+
+from extractor.connectors.imap_gmail import GmailIMAPConnector
+from extractor.email.reader import EmailReader
+
+
+def _raw(uid: bytes) -> bytes:
+    return b"From: vendor@example.com\r\nSubject: Role " + uid + b"\r\n\r\nBody"
+
+
+class FakeIMAPServer:
+    """
+    Answers LOGIN/SELECT/UID like imaplib. Multi-UID fetches containing
+    `bad_uid` return NO; from fetch number `abort_from` on, the socket is dead.
+    """
+
+    def __init__(self, uid_count: int, bad_uid: bytes = None, abort_from: int = None):
+        self.uids = [str(i).encode() for i in range(1, uid_count + 1)]
+        self.bad_uid = bad_uid
+        self.abort_from = abort_from
+        self.state = "AUTH"
+        self.fetch_calls = []
+
+    def login(self, user, password):
+        return "OK", [b"Logged in"]
+
+    def select(self, folder):
+        self.state = "SELECTED"
+        return "OK", [str(len(self.uids)).encode()]
+
+    def noop(self):
+        return "OK", [b"NOOP completed"]
+
+    def uid(self, command, *args):
+        if command == "search":
+            return "OK", [b" ".join(self.uids)]
+        uid_set = args[0]
+        self.fetch_calls.append(uid_set)
+        if self.abort_from is not None and len(self.fetch_calls) >= self.abort_from:
+            raise imaplib.IMAP4.abort("socket error: EOF")
+        uids = uid_set.split(b",")
+        if len(uids) > 1 and self.bad_uid in uids:
+            return "NO", [b"FETCH failed"]
+        return "OK", [(b"%s (UID %s RFC822 {10}" % (u, u), _raw(u)) for u in uids]
+
+
+class TestFetchEmails(unittest.TestCase):
+
+    def _reader(self, *servers, fetch_batch_size: int = 100) -> EmailReader:
+        """Reader on a real connector; each IMAP4_SSL() call yields the next server (or raises)."""
+        patcher = patch("imaplib.IMAP4_SSL", side_effect=list(servers))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        connector = GmailIMAPConnector("candidate@example.com", "app-password")
+        return EmailReader(connector, fetch_batch_size=fetch_batch_size)
+
+    def _uids(self, emails):
+        return [e["uid"] for e in emails]
+
+    def test_batch_fetch_is_one_command_newest_first(self):
+        server = FakeIMAPServer(3)
+        emails, next_start_index = self._reader(server).fetch_emails()
+
+        self.assertEqual(self._uids(emails), ["3", "2", "1"])
+        self.assertEqual(server.fetch_calls, [b"3,2,1"])
+        self.assertIsNone(next_start_index)
+
+    def test_failed_batch_is_split_down_to_single_fetches(self):
+        server = FakeIMAPServer(4, bad_uid=b"2")
+        emails, _ = self._reader(server).fetch_emails()
+
+        self.assertEqual(self._uids(emails), ["4", "3", "2", "1"])
+        self.assertEqual(server.fetch_calls[0], b"4,3,2,1")
+        self.assertIn(b"2", server.fetch_calls)
+
+    def test_dropped_connection_reconnects_once(self):
+        dead = FakeIMAPServer(2, abort_from=1)
+        fresh = FakeIMAPServer(2)
+        emails, _ = self._reader(dead, fresh).fetch_emails()
+
+        self.assertEqual(self._uids(emails), ["2", "1"])
+        self.assertEqual(dead.fetch_calls, [b"2,1"])
+        self.assertEqual(fresh.fetch_calls, [b"2,1"])
+        self.assertEqual(fresh.state, "SELECTED")
+
+    def test_lost_connection_keeps_earlier_chunks_and_pagination(self):
+        server = FakeIMAPServer(6, abort_from=2)
+        reader = self._reader(server, OSError("Network is unreachable"), fetch_batch_size=2)
+
+        emails, next_start_index = reader.fetch_emails(batch_size=4)
+
+        self.assertEqual(self._uids(emails), ["6", "5"])
+        self.assertEqual(next_start_index, 4)
+        # The dead chunk is not split into further FETCHes
+        self.assertEqual(server.fetch_calls, [b"6,5", b"4,3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
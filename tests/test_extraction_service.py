@@ -0,0 +1,104 @@
+"""
+Tests for EmailExtractionService run orchestration.
+
+    python -m pytest tests/test_extraction_service.py -v
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from extractor.core.settings import ConfigLoader
+from extractor.orchestration import service as service_module
+from extractor.orchestration.candidate_runner import CandidateRunResult
+from extractor.orchestration.service import EmailExtractionService
+from extractor.state.uid_tracker import UIDTracker
+
+
+CONFIG_PATH = Path(__file__).resolve().parents[1] / "configs" / "config.yaml"
+CANDIDATES = [{"id": i, "email": f"c{i}@example.com"} for i in range(1, 5)]
+
+
+class SlowFirstRunner:
+    """Earlier candidates take longer, so completion order is the reverse of submission order."""
+
+    def __init__(self):
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def run(self, candidate):
+        with self._lock:
+            self.threads.add(threading.current_thread().name)
+        time.sleep(0.02 * (len(CANDIDATES) - candidate["id"]))
+        return CandidateRunResult(
+            candidate_id=candidate["id"],
+            email=candidate["email"],
+            status="success",
+            emails_fetched=1,
+            last_uid=str(candidate["id"]),
+        )
+
+
+class ServiceTestCase(unittest.TestCase):
+    """Builds the service through its constructor with offline collaborators."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir, True)
+        self.runner = SlowFirstRunner()
+        tracker = UIDTracker(os.path.join(self.tmp_dir, "last_run.json"))
+        for patcher in (
+            patch.object(service_module, "_PROJECT_ROOT", Path(self.tmp_dir)),
+            patch.object(service_module, "get_config", return_value=ConfigLoader(CONFIG_PATH)),
+            patch.object(service_module, "get_api_client", side_effect=RuntimeError("API offline")),
+            patch.object(service_module, "ContactExtractor"),
+            patch.object(service_module, "EmailFilter"),
+            patch.object(service_module, "get_uid_tracker", return_value=tracker),
+            patch.object(service_module, "CandidateRunner", return_value=self.runner),
+            patch.dict(os.environ, {"SMTP_SERVER": ""}),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _service(self, **runtime_parameters) -> EmailExtractionService:
+        candidate_source = MagicMock()
+        candidate_source.get_active_candidates.return_value = list(CANDIDATES)
+        return EmailExtractionService(candidate_source, run_id="test-run", runtime_parameters=runtime_parameters)
+
+
+class TestCandidateConcurrency(ServiceTestCase):
+
+    def _candidate_ids(self, summary):
+        return [c["candidate_id"] for c in summary["candidates"]]
+
+    def test_sequential_by_default(self):
+        summary = self._service().run()
+        self.assertEqual(len(self.runner.threads), 1)
+        self.assertEqual(self._candidate_ids(summary), [1, 2, 3, 4])
+
+    def test_results_keep_submission_order_when_concurrent(self):
+        summary = self._service(candidate_concurrency=4).run()
+        self.assertGreater(len(self.runner.threads), 1)
+        self.assertEqual(self._candidate_ids(summary), [1, 2, 3, 4])
+
+
+class TestJsonReport(ServiceTestCase):
+
+    def _latest_reports(self):
+        return sorted(p.name for p in (Path(self.tmp_dir) / "output" / "reports").glob("latest_*"))
+
+    def test_latest_alias_follows_compression_toggle(self):
+        self._service(compress_reports=True)._save_json_report({"run": 1})
+        self.assertEqual(self._latest_reports(), ["latest_extraction_report.json.gz"])
+
+        self._service()._save_json_report({"run": 2})
+        self.assertEqual(self._latest_reports(), ["latest_extraction_report.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
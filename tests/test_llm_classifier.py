@@ -0,0 +1,113 @@
+"""
+Tests for LLMJobClassifier batch entry points and RequestBatcher error handling.
+
+    python -m pytest tests/test_llm_classifier.py -v
+"""
+
+import asyncio
+import functools
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from extractor.extraction.llm_classifier import LLMJobClassifier, RequestBatcher
+
+
+GOOD_TEXT = "Senior Java Developer needed in Dallas, TX. 12 month contract, W2. Send resume."
+BAD_TEXT = "Python Data Engineer role in Austin, TX. Hybrid, long term contract. Send resume."
+
+VALID_RESPONSE = {"response": '{"label": "valid_job", "confidence": 0.9, "reasoning": "ok"}'}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    body = request.content.decode()
+    # Coalesced requests and BAD_TEXT fail with a non-retryable client error
+    if "### TEXT" in body or "Austin" in body:
+        return httpx.Response(400, json={})
+    return httpx.Response(200, json=VALID_RESPONSE)
+
+
+def _classifier(test_case: unittest.TestCase) -> LLMJobClassifier:
+    """Classifier whose sync and async httpx clients are answered by _handler."""
+    transport = httpx.MockTransport(_handler)
+    for name in ("Client", "AsyncClient"):
+        patcher = patch.object(httpx, name, functools.partial(getattr(httpx, name), transport=transport))
+        patcher.start()
+        test_case.addCleanup(patcher.stop)
+    return LLMJobClassifier(base_url="http://llm.test")
+
+
+class TestRequestBatcherErrors(unittest.TestCase):
+
+    def setUp(self):
+        self.classifier = _classifier(self)
+
+    def _run(self, coro):
+        return asyncio.run(asyncio.wait_for(coro, timeout=5))
+
+    def test_single_text_http_error_raises_instead_of_hanging(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            self._run(self.classifier.abatch_classify([BAD_TEXT], coalesce=True))
+
+    def test_fallback_resolves_each_text_independently(self):
+        async def classify_both():
+            client = self.classifier._get_async_client()
+            batcher = RequestBatcher(self.classifier, client, max_batch_size=2)
+            try:
+                return await asyncio.gather(
+                    batcher.classify(GOOD_TEXT),
+                    batcher.classify(BAD_TEXT),
+                    return_exceptions=True,
+                )
+            finally:
+                await self.classifier.aclose()
+
+        good, bad = self._run(classify_both())
+        self.assertTrue(good["is_valid"])
+        self.assertIsInstance(bad, httpx.HTTPStatusError)
+
+    def test_coalesce_matches_uncoalesced_behaviour(self):
+        with self.assertRaises(httpx.HTTPStatusError):
+            self._run(self.classifier.abatch_classify([BAD_TEXT], coalesce=False))
+
+    def test_coalesced_texts_respect_max_workers(self):
+        in_flight = peak = 0
+        classify = RequestBatcher.classify
+
+        async def tracked_classify(batcher, text):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await classify(batcher, text)
+            finally:
+                in_flight -= 1
+
+        texts = [f"{GOOD_TEXT} Req #{i}" for i in range(8)]
+        with patch.object(RequestBatcher, "classify", tracked_classify):
+            results = self._run(self.classifier.abatch_classify(texts, max_workers=2, coalesce=True))
+
+        self.assertEqual(len(results), 8)
+        self.assertEqual(peak, 2)
+
+
+class TestBatchClassify(unittest.TestCase):
+
+    def setUp(self):
+        self.classifier = _classifier(self)
+
+    def test_batch_classify_without_event_loop(self):
+        results = self.classifier.batch_classify([GOOD_TEXT])
+        self.assertTrue(results[0]["is_valid"])
+
+    def test_batch_classify_inside_running_event_loop(self):
+        async def call_sync_api():
+            return self.classifier.batch_classify([GOOD_TEXT])
+
+        results = asyncio.run(call_sync_api())
+        self.assertTrue(results[0]["is_valid"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for UIDTracker bulk updates and the atomic last_run.json write.
+
+    python -m pytest tests/test_uid_tracker.py -v
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from extractor.state.uid_tracker import UIDTracker
+
+
+class TestUIDTracker(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.tracker_file = os.path.join(self.tmp_dir, "last_run.json")
+        with open(self.tracker_file, "w") as f:
+            json.dump({"old@example.com": {"last_uid": "500", "last_run": "2026-01-01T00:00:00"}}, f)
+        self.tracker = UIDTracker(self.tracker_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _on_disk(self):
+        with open(self.tracker_file) as f:
+            return json.load(f)
+
+    def test_bulk_update_writes_file_once(self):
+        with patch.object(self.tracker, "_save", wraps=self.tracker._save) as save:
+            changed = self.tracker.update_last_uids_bulk({
+                "A@Example.com ": ("10", False),
+                "b@example.com": ("20", False),
+            })
+        self.assertEqual(changed, 2)
+        save.assert_called_once()
+        data = self._on_disk()
+        self.assertEqual(data["a@example.com"]["last_uid"], "10")
+        self.assertEqual(data["b@example.com"]["last_uid"], "20")
+
+    def test_bulk_update_never_regresses_uid(self):
+        changed = self.tracker.update_last_uids_bulk({
+            "old@example.com": ("100", False),
+            "bad@example.com": ("not-a-uid", False),
+        })
+        self.assertEqual(changed, 0)
+        self.assertEqual(self._on_disk()["old@example.com"]["last_uid"], "500")
+        self.assertNotIn("bad@example.com", self._on_disk())
+
+    def test_forced_timestamp_keeps_higher_uid(self):
+        changed = self.tracker.update_last_uids_bulk({"old@example.com": ("100", True)})
+        self.assertEqual(changed, 1)
+        entry = self._on_disk()["old@example.com"]
+        self.assertEqual(entry["last_uid"], "500")
+        self.assertNotEqual(entry["last_run"], "2026-01-01T00:00:00")
+
+    def test_no_changes_skip_the_write(self):
+        with patch.object(self.tracker, "_save") as save:
+            self.tracker.update_last_uids_bulk({"old@example.com": ("1", False)})
+        save.assert_not_called()
+
+    def test_save_replaces_file_atomically(self):
+        self.tracker.update_last_uid("new@example.com", "7")
+        self.assertEqual(self._on_disk()["new@example.com"]["last_uid"], "7")
+        self.assertEqual(os.listdir(self.tmp_dir), ["last_run.json"])
+
+    def test_failed_write_leaves_previous_file_intact(self):
+        def broken_dump(data, f, **kwargs):
+            f.write('{"truncated": ')
+            raise OSError("disk full")
+
+        with patch("extractor.state.uid_tracker.json.dump", side_effect=broken_dump):
+            self.tracker.update_last_uid("new@example.com", "7")
+
+        data = self._on_disk()
+        self.assertEqual(list(data), ["old@example.com"])
+        self.assertEqual(data["old@example.com"]["last_uid"], "500")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,234 @@
+"""
+Tests for VendorUtil contact validation, bulk requests and the write buffer.
+
+    python -m pytest tests/test_vendor_contacts.py -v
+"""
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from extractor.persistence import vendor_contacts
+from extractor.persistence.vendor_contacts import VendorUtil
+
+
+class FakeAPIClient:
+    """Records POSTs; check-emails reports `remote_existing`, bulk inserts may report failures."""
+
+    def __init__(self, remote_existing=(), failed_per_batch=0):
+        self.remote_existing = set(remote_existing)
+        self.failed_per_batch = failed_per_batch
+        self.posts = []
+        self._lock = threading.Lock()
+
+    def post(self, endpoint, data):
+        with self._lock:
+            self.posts.append((endpoint, data))
+        if endpoint.endswith("/check-emails"):
+            return {"existing_emails": [e for e in data["emails"] if e in self.remote_existing]}
+        if endpoint.endswith("/automation-extracts/bulk"):
+            rows = data["extracts"]
+            return {"total": len(rows), "inserted": len(rows) - self.failed_per_batch,
+                    "duplicates": 0, "failed": self.failed_per_batch}
+        return {}
+
+    def calls(self, suffix):
+        return [data for endpoint, data in self.posts if endpoint.endswith(suffix)]
+
+
+def _vendor_util(api_client=None) -> VendorUtil:
+    """VendorUtil on the given API client, with a filter repository that allows every email."""
+    filter_repo = MagicMock()
+    filter_repo.check_email.return_value = None
+    filter_repo.check_emails_bulk.side_effect = lambda emails: {e: None for e in emails if e}
+    with patch.object(vendor_contacts, "get_filter_repository", return_value=filter_repo):
+        return VendorUtil(api_client if api_client is not None else MagicMock())
+
+
+class TestIsValidContact(unittest.TestCase):
+
+    def setUp(self):
+        self.util = _vendor_util()
+
+    def assertValid(self, contact, email_lc=None):
+        self.assertTrue(self.util._is_valid_contact(contact, email_lc), contact)
+
+    def assertInvalid(self, contact, email_lc=None):
+        self.assertFalse(self.util._is_valid_contact(contact, email_lc), contact)
+
+    def test_requires_email_or_linkedin(self):
+        self.assertInvalid({"name": "Jane Doe"})
+        self.assertValid({"linkedin_id": "jane-doe"})
+        self.assertValid({"email": "jane@vendor.com"})
+
+    def test_email_needs_at_sign_and_dot(self):
+        self.assertInvalid({"email": "jane.vendor.com"})
+        self.assertInvalid({"email": "jane@vendor"})
+        # Same predicate as before: any "@" plus any "."
+        self.assertValid({"email": "jane.doe@localhost"})
+        self.assertValid({"email": "jane@doe@vendor.com"})
+
+    def test_blocked_mailboxes(self):
+        for email in ("noreply@vendor.com", "no-reply@vendor.com", "info@vendor.com",
+                      "support@vendor.com", "admin@vendor.com", "NoReply@Vendor.com"):
+            self.assertInvalid({"email": email})
+        self.assertValid({"email": "information.desk@vendor.com"})
+
+    def test_precomputed_email_is_used(self):
+        contact = {"email": "  Jane@Vendor.com "}
+        self.assertValid(contact, email_lc="jane@vendor.com")
+        self.assertInvalid(contact, email_lc="noreply@vendor.com")
+
+    def test_linkedin_shape(self):
+        self.assertInvalid({"linkedin_id": "jane doe"})
+        self.assertInvalid({"linkedin_id": "x" * 81})
+
+    def test_name_shape(self):
+        self.assertValid({"email": "jane@vendor.com", "name": "Jane Doe"})
+        self.assertInvalid({"email": "jane@vendor.com", "name": "Jane"})
+        self.assertInvalid({"email": "jane@vendor.com", "name": "a b c d e f g"})
+        self.assertInvalid({"email": "jane@vendor.com", "name": "Jane Doe2"})
+
+
+class TestContactExtractRow(unittest.TestCase):
+
+    CONTACT = {"email": "jane@vendor.com", "name": "Jane Doe", "candidate_id": 7, "raw_body": "x" * 5000}
+
+    def test_raw_payload_omits_column_fields(self):
+        row = VendorUtil._contact_extract_row(self.CONTACT, is_duplicate=False)
+        self.assertEqual(row["raw_payload"], {"candidate_id": 7, "raw_body": "x" * 5000})
+        self.assertEqual(row["processing_status"], "new")
+
+    def test_duplicate_rows_truncate_long_strings(self):
+        row = VendorUtil._contact_extract_row(self.CONTACT, is_duplicate=True)
+        self.assertEqual(row["raw_payload"]["candidate_id"], 7)
+        self.assertEqual(len(row["raw_payload"]["raw_body"]), vendor_contacts._DUPLICATE_PAYLOAD_MAX_CHARS)
+        self.assertEqual(len(self.CONTACT["raw_body"]), 5000)
+
+
+class TestPostVendorContacts(unittest.TestCase):
+
+    def test_batches_go_through_one_shared_pool(self):
+        api = FakeAPIClient()
+        util = _vendor_util(api)
+        result = {"contacts_inserted": 0, "contacts_skipped": 0}
+        contacts = [{"email": f"v{i}@vendor.com"} for i in range(1200)]
+
+        self.assertTrue(util._post_vendor_contacts(contacts, result))
+        pool = vendor_contacts._EXECUTORS["vendor-contact"]
+        self.assertTrue(util._post_vendor_contacts(contacts[:10], result))
+
+        self.assertIs(vendor_contacts._EXECUTORS["vendor-contact"], pool)
+        self.assertEqual(sorted(len(d["contacts"]) for d in api.calls("/vendor_contact/bulk")), [10, 200, 500, 500])
+        self.assertEqual(result["contacts_inserted"], 1210)
+
+
+class TestSaveContacts(unittest.TestCase):
+
+    def test_warm_up_known_emails_are_skipped_without_an_audit_row(self):
+        api = FakeAPIClient(remote_existing={"dup@vendor.com"})
+        util = _vendor_util(api)
+        util.add_known_global_emails({"known@vendor.com"})
+        checked = []
+
+        def check_emails_bulk(emails):
+            checked.extend(emails)
+            return dict.fromkeys(checked)
+
+        util.filter_repo.check_emails_bulk.side_effect = check_emails_bulk
+        contacts = [
+            {"email": "Known@Vendor.com", "name": "Jane Doe", "source": "candidate@example.com"},
+            {"email": "dup@vendor.com", "name": "John Roe", "source": "candidate@example.com"},
+        ]
+
+        result = util.save_contacts(contacts)
+
+        self.assertEqual(result["contacts_skipped"], 2)
+        self.assertEqual(checked, ["dup@vendor.com"])
+        self.assertEqual([d["emails"] for d in api.calls("/check-emails")], [["dup@vendor.com"]])
+        rows = [row for d in api.calls("/automation-extracts/bulk") for row in d["extracts"]]
+        self.assertEqual([(r["email"], r["processing_status"]) for r in rows], [("dup@vendor.com", "duplicate")])
+
+
+class TestGlobalEmailCheck(unittest.TestCase):
+
+    def test_check_emails_batches_unique_unknown_emails(self):
+        emails = [f"v{i}@vendor.com" for i in range(2500)]
+        api = FakeAPIClient(remote_existing={"v5@vendor.com", "v2400@vendor.com"})
+        util = _vendor_util(api)
+        util.add_known_global_emails({"v0@vendor.com"})
+
+        existing = util.get_globally_existing_emails(emails + emails[:10])
+
+        batches = [data["emails"] for data in api.calls("/check-emails")]
+        self.assertEqual([len(b) for b in batches], [1000, 1000, 499])
+        self.assertNotIn("v0@vendor.com", batches[0])
+        self.assertEqual(existing, {"v0@vendor.com", "v5@vendor.com", "v2400@vendor.com"})
+
+    def test_remote_hits_are_remembered(self):
+        api = FakeAPIClient(remote_existing={"v5@vendor.com"})
+        util = _vendor_util(api)
+        util.get_globally_existing_emails(["v5@vendor.com", "v6@vendor.com"])
+
+        api.posts.clear()
+        self.assertEqual(util.get_globally_existing_emails(["v5@vendor.com"]), {"v5@vendor.com"})
+        self.assertEqual(api.posts, [])
+
+
+class TestBulkInsertContactExtracts(unittest.TestCase):
+
+    def test_rows_are_posted_in_chunks_of_500(self):
+        api = FakeAPIClient()
+        util = _vendor_util(api)
+        rows = [{"email": f"v{i}@vendor.com"} for i in range(1200)]
+
+        inserted, skipped = util._bulk_insert_contact_extracts(rows)
+
+        self.assertEqual([len(d["extracts"]) for d in api.calls("/automation-extracts/bulk")], [500, 500, 200])
+        self.assertEqual((inserted, skipped), (1200, 0))
+
+    def test_audited_emails_become_known(self):
+        util = _vendor_util(FakeAPIClient())
+        util._bulk_insert_contact_extracts([{"email": " V1@Vendor.com"}, {"email": "v2@vendor.com"}])
+        self.assertEqual(util._known_global_emails, {"v1@vendor.com", "v2@vendor.com"})
+
+    def test_batches_with_failures_are_not_marked_known(self):
+        util = _vendor_util(FakeAPIClient(failed_per_batch=1))
+        util._bulk_insert_contact_extracts([{"email": "v1@vendor.com"}, {"email": "v2@vendor.com"}])
+        self.assertEqual(util._known_global_emails, frozenset())
+
+
+class TestWriteBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.util = _vendor_util(FakeAPIClient())
+        patcher = patch.object(
+            self.util, "save_contacts",
+            side_effect=lambda batch, seen_keys=None: {"contacts_inserted": len(batch)},
+        )
+        self.save_contacts = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_flushes_when_size_is_reached(self):
+        seen_keys = set()
+        self.assertEqual(self.util.submit_contacts([{"email": "a@v.com"}], seen_keys, flush_size=2, flush_interval=60), {})
+        result = self.util.submit_contacts([{"email": "b@v.com"}], seen_keys, flush_size=2, flush_interval=60)
+
+        self.assertEqual(result, {"contacts_inserted": 2})
+        self.save_contacts.assert_called_once()
+        self.assertIs(self.save_contacts.call_args.kwargs["seen_keys"], seen_keys)
+
+    def test_flushes_when_interval_has_passed(self):
+        self.assertEqual(self.util.submit_contacts([{"email": "a@v.com"}], flush_size=10, flush_interval=0),
+                         {"contacts_inserted": 1})
+
+    def test_flush_contacts_drains_the_remainder(self):
+        self.util.submit_contacts([{"email": "a@v.com"}], flush_size=10, flush_interval=60)
+
+        self.assertEqual(self.util.flush_contacts(), {"contacts_inserted": 1})
+        self.assertEqual(self.util.flush_contacts(), {})
+        self.save_contacts.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()